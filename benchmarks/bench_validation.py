@@ -0,0 +1,84 @@
+"""
+Import-time and per-call validation overhead benchmark.
+
+    poetry run python benchmarks/bench_validation.py
+"""
+
+import statistics
+import subprocess
+import sys
+import timeit
+
+RUNS = 10
+
+BATTLE = {
+    "battleTime": "20251118T183123.000Z",
+    "event": {"id": 15000005, "mode": "brawlBall", "modeId": 5, "map": "Super Beach"},
+    "battle": {
+        "mode": "brawlBall",
+        "type": "ranked",
+        "result": "victory",
+        "duration": 120,
+        "trophyChange": 8,
+        "teams": [
+            [
+                {
+                    "tag": f"#P{team}{i}",
+                    "name": f"Player {team}{i}",
+                    "brawler": {"id": 16000000 + i, "name": "SHELLY", "power": 11, "trophies": 750},
+                }
+                for i in range(3)
+            ]
+            for team in range(2)
+        ],
+    },
+}
+BATTLELOG = {"items": [BATTLE] * 25, "paging": {"cursors": {}}}
+
+
+def import_time(statement: str) -> float:
+    """Median wall time of a fresh interpreter running `statement`, in ms."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    samples = [
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for _ in range(RUNS)
+    ]
+    return statistics.median(samples) * 1000
+
+
+def per_call(stmt, number: int = 2000) -> float:
+    """Mean time per call, in µs."""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    print("Import time (median of fresh interpreters)")
+    print(f"  import brawldogg                 {import_time('import brawldogg'):8.1f} ms")
+    print(f"  import brawldogg.models.player   {import_time('import brawldogg.models.player'):8.1f} ms")
+    print(
+        "  import + prebuild all validators "
+        f"{import_time('import brawldogg.models.registry as r; r.prebuild()'):8.1f} ms"
+    )
+
+    from brawldogg.models import BattleLogEntry, PagingResponse
+    from brawldogg.models.registry import get_adapter
+
+    adapter = get_adapter("battlelog")
+
+    print("\nPer-call validation of a 25-entry battle log")
+    print(
+        "  PagingResponse[model].model_validate "
+        f"{per_call(lambda: PagingResponse[BattleLogEntry].model_validate(BATTLELOG)):8.1f} µs"
+    )
+    print(
+        "  per-item model_validate              "
+        f"{per_call(lambda: [BattleLogEntry.model_validate(x) for x in BATTLELOG['items']]):8.1f} µs"
+    )
+    print(
+        "  registry TypeAdapter.validate_python "
+        f"{per_call(lambda: adapter.validate_python(BATTLELOG)):8.1f} µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
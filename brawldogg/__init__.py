@@ -1 +1,2 @@
-from .client import BrawlStarsClient
+from .client import BrawlStarsClient, Polled
+from .sync import SyncBrawlStarsClient
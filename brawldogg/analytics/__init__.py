@@ -0,0 +1,10 @@
+from .meta import MetaAggregate, MetaAggregator
+from .table import BRAWLER_COLUMNS, PLAYER_COLUMNS, PlayerTable
+
+__all__ = [
+    "PlayerTable",
+    "MetaAggregator",
+    "MetaAggregate",
+    "PLAYER_COLUMNS",
+    "BRAWLER_COLUMNS",
+]
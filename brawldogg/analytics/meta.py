@@ -0,0 +1,298 @@
+from datetime import timezone
+from hashlib import blake2b
+from typing import Iterable
+
+import numpy as np
+
+from ..models.battlelog import BattleLogEntry, DuelBattle, SoloBattle, TeamBattle
+
+BRAWLER_ID_BASE = 16_000_000
+
+# Lower edges of the brawler trophy brackets
+DEFAULT_BRACKETS = (0, 300, 500, 750, 1000, 1250)
+
+PICKS, WINS = 0, 1
+
+
+def _canonical_tag(tag: str) -> str:
+    tag = tag.strip().upper()
+    return tag if tag.startswith("#") else f"#{tag}"
+
+
+class MetaAggregate:
+    """
+    Pick and win counters for a set of battles.
+
+    Counters for each (mode, map) live in one int64 array of shape
+    (brawler slot, trophy bracket, [picks, wins]), where the brawler slot is
+    `brawler_id - 16000000`. Aggregates from different workers or time
+    windows combine with `merge`.
+    """
+
+    def __init__(self, n_brackets: int):
+        self.n_brackets = n_brackets
+        self.counters: dict[tuple[str, str], np.ndarray] = {}
+        self.battles: dict[tuple[str, str], int] = {}
+
+    def _counter(self, key: tuple[str, str], slot: int) -> np.ndarray:
+        counter = self.counters.get(key)
+        if counter is None or slot >= counter.shape[0]:
+            size = max(slot + 1, 128 if counter is None else counter.shape[0] * 2)
+            grown = np.zeros((size, self.n_brackets, 2), np.int64)
+            if counter is not None:
+                grown[: counter.shape[0]] = counter
+            counter = self.counters[key] = grown
+        return counter
+
+    def count(self, key: tuple[str, str], picks: list[tuple[int, int, bool]]) -> None:
+        """Counts one battle: (brawler_id, bracket, won) per pick."""
+        self.battles[key] = self.battles.get(key, 0) + 1
+        for brawler_id, bracket, won in picks:
+            slot = brawler_id - BRAWLER_ID_BASE
+            counter = self._counter(key, slot)
+            counter[slot, bracket, PICKS] += 1
+            counter[slot, bracket, WINS] += won
+
+    def merge(self, other: "MetaAggregate") -> None:
+        for key, counter in other.counters.items():
+            own = self._counter(key, counter.shape[0] - 1)
+            own[: counter.shape[0]] += counter
+            self.battles[key] = self.battles.get(key, 0) + other.battles.get(key, 0)
+
+    def totals(
+        self,
+        mode: str | None = None,
+        map: str | None = None,
+        bracket: int | None = None,
+    ) -> tuple[np.ndarray, int]:
+        """Summed (slot, [picks, wins]) counters and battle count for a filter."""
+        keys = [
+            key
+            for key in self.counters
+            if (mode is None or key[0] == mode) and (map is None or key[1] == map)
+        ]
+        size = max((self.counters[key].shape[0] for key in keys), default=0)
+        total = np.zeros((size, 2), np.int64)
+        for key in keys:
+            counter = self.counters[key]
+            summed = counter.sum(axis=1) if bracket is None else counter[:, bracket]
+            total[: counter.shape[0]] += summed
+        return total, sum(self.battles.get(key, 0) for key in keys)
+
+    def rates(
+        self,
+        mode: str | None = None,
+        map: str | None = None,
+        bracket: int | None = None,
+    ) -> dict[int, dict[str, float]]:
+        """Picks, wins, win rate and pick rate (picks per battle) per brawler id."""
+        total, battles = self.totals(mode, map, bracket)
+        return {
+            BRAWLER_ID_BASE + slot: {
+                "picks": int(picks),
+                "wins": int(wins),
+                "win_rate": wins / picks,
+                "pick_rate": picks / battles,
+            }
+            for slot, (picks, wins) in enumerate(total)
+            if picks
+        }
+
+
+class MetaAggregator:
+    """
+    Incremental meta statistics over battle logs.
+
+    Battle logs are fed per player with `add`. The same battle seen from
+    several participants' logs is counted once (battles are identified by
+    time, event and participant tags; ids are remembered for
+    `dedup_horizon` seconds of battle time). Counters are bucketed into
+    windows of `window` seconds, so `rollup` can answer any time range.
+
+    Parallel workers usually see the same battles (a 3v3 battle appears in
+    up to six logs), and counted battles can't be separated after the fact.
+    Give each of `n` workers `shard=(i, n)`: a worker only counts battles
+    whose id hashes to its shard, so every battle is counted by exactly one
+    worker and the workers' aggregators combine with `merge` without double
+    counting.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 3600,
+        brackets: Iterable[int] = DEFAULT_BRACKETS,
+        dedup_horizon: int = 2 * 24 * 3600,
+        shard: tuple[int, int] | None = None,
+    ):
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            raise ValueError(f"Invalid shard {shard}: expected (index, count) with index < count")
+        self.window = window
+        self.brackets = np.asarray(tuple(brackets), np.int64)
+        self.dedup_horizon = dedup_horizon
+        self.windows: dict[int, MetaAggregate] = {}
+        self.shard = shard
+        self.duplicates = 0
+        # Battles left to other shards
+        self.not_owned = 0
+        self.merge_overlap = 0
+        self._seen: dict[bytes, int] = {}
+        self._newest = 0
+        self._pruned_at = 0
+
+    def _bracket(self, trophies: int) -> int:
+        return max(0, int(np.searchsorted(self.brackets, trophies, side="right")) - 1)
+
+    def _picks(
+        self, owner: str, entry: BattleLogEntry
+    ) -> tuple[list[str], list[tuple[int, int, bool]]] | None:
+        """Participant tags and (brawler_id, bracket, won) picks of a battle."""
+        battle = entry.battle
+        match battle:
+            case TeamBattle():
+                own_team = next(
+                    (
+                        i
+                        for i, team in enumerate(battle.teams)
+                        if any(_canonical_tag(p.tag) == owner for p in team)
+                    ),
+                    None,
+                )
+                tags, picks = [], []
+                for i, team in enumerate(battle.teams):
+                    if battle.result == "victory":
+                        won = i == own_team
+                    elif battle.result == "defeat":
+                        won = own_team is not None and i != own_team
+                    else:
+                        won = False
+                    for p in team:
+                        tags.append(p.tag)
+                        picks.append(
+                            (p.brawler.id, self._bracket(p.brawler.trophies), won)
+                        )
+                return tags, picks
+
+            case SoloBattle():
+                # Players are listed in finishing order; the top half wins
+                cutoff = len(battle.players) / 2
+                return [p.tag for p in battle.players], [
+                    (p.brawler.id, self._bracket(p.brawler.trophies), i < cutoff)
+                    for i, p in enumerate(battle.players)
+                ]
+
+            case DuelBattle():
+                tags, picks = [], []
+                for p in battle.players:
+                    is_owner = _canonical_tag(p.tag) == owner
+                    match battle.result:
+                        case "victory":
+                            won = is_owner
+                        case "defeat":
+                            won = not is_owner
+                        case _:
+                            won = False
+                    tags.append(p.tag)
+                    picks.extend(
+                        (b.id, self._bracket(b.trophies), won) for b in p.brawlers
+                    )
+                return tags, picks
+
+            case _:
+                # PvE (BossBattle) says nothing about the competitive meta
+                return None
+
+    def _battle_id(self, entry: BattleLogEntry, tags: list[str]) -> bytes:
+        digest = blake2b(digest_size=12)
+        digest.update(entry.battle_time.isoformat().encode())
+        digest.update(str(entry.event.id).encode())
+        for tag in sorted(_canonical_tag(t) for t in tags):
+            digest.update(tag.encode())
+        return digest.digest()
+
+    def _owns(self, battle_id: bytes) -> bool:
+        if self.shard is None:
+            return True
+        index, count = self.shard
+        return int.from_bytes(battle_id[:8], "little") % count == index
+
+    def add(self, player_tag: str, entries: Iterable[BattleLogEntry]) -> int:
+        """Counts the battles of one player's log; returns how many were new."""
+        owner = _canonical_tag(player_tag)
+        added = 0
+
+        for entry in entries:
+            if (picked := self._picks(owner, entry)) is None:
+                continue
+            tags, picks = picked
+
+            ts = int(entry.battle_time.replace(tzinfo=timezone.utc).timestamp())
+            battle_id = self._battle_id(entry, tags)
+            if not self._owns(battle_id):
+                self.not_owned += 1
+                continue
+            if battle_id in self._seen:
+                self.duplicates += 1
+                continue
+            self._seen[battle_id] = ts
+            self._newest = max(self._newest, ts)
+
+            start = ts - ts % self.window
+            if (aggregate := self.windows.get(start)) is None:
+                aggregate = self.windows[start] = MetaAggregate(len(self.brackets))
+
+            mode = entry.event.mode or entry.battle.mode
+            aggregate.count((mode, entry.event.map or ""), picks)
+            added += 1
+
+        # Prune by battle time, not size: a full scan at most once per quarter
+        # horizon keeps adds O(1) amortized however many battles are in range
+        if self._newest - self._pruned_at >= self.dedup_horizon / 4:
+            self._prune_seen()
+        return added
+
+    def _prune_seen(self) -> None:
+        cutoff = self._newest - self.dedup_horizon
+        self._seen = {k: ts for k, ts in self._seen.items() if ts >= cutoff}
+        self._pruned_at = self._newest
+
+    def merge(self, other: "MetaAggregator") -> None:
+        """Folds another aggregator (e.g. from a parallel worker) into this one."""
+        if other.window != self.window or not np.array_equal(
+            other.brackets, self.brackets
+        ):
+            raise ValueError("Cannot merge aggregators with different windows/brackets")
+
+        # Battles counted by both sides can't be separated after the fact;
+        # they are counted twice and reported in `merge_overlap`. Sharded
+        # workers never overlap.
+        self.merge_overlap += len(self._seen.keys() & other._seen.keys())
+
+        for start, aggregate in other.windows.items():
+            if (own := self.windows.get(start)) is None:
+                own = self.windows[start] = MetaAggregate(len(self.brackets))
+            own.merge(aggregate)
+
+        self._seen.update(other._seen)
+        self._newest = max(self._newest, other._newest)
+        self.duplicates += other.duplicates
+        self.not_owned += other.not_owned
+
+    def rollup(self, since: int | None = None, until: int | None = None) -> MetaAggregate:
+        """Combines the windows overlapping [since, until) (epoch seconds)."""
+        result = MetaAggregate(len(self.brackets))
+        for start, aggregate in self.windows.items():
+            if since is not None and start + self.window <= since:
+                continue
+            if until is not None and start >= until:
+                continue
+            result.merge(aggregate)
+        return result
+
+    def drop_before(self, ts: int) -> None:
+        """Discards windows that ended before `ts`, bounding memory on long runs."""
+        self.windows = {
+            start: aggregate
+            for start, aggregate in self.windows.items()
+            if start + self.window > ts
+        }
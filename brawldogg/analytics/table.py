@@ -0,0 +1,223 @@
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("brawldogg.analytics requires numpy: pip install numpy") from e
+
+from ..models.player import Player
+
+# Player-level column → (payload key, dtype)
+PLAYER_COLUMNS = {
+    "trophies": ("trophies", np.int32),
+    "highest_trophies": ("highestTrophies", np.int32),
+    "exp_level": ("expLevel", np.int32),
+    "victories_3vs3": ("3vs3Victories", np.int32),
+    "solo_victories": ("soloVictories", np.int32),
+    "duo_victories": ("duoVictories", np.int32),
+}
+
+# Player × brawler matrices → (payload key, dtype). Power 0 means "not unlocked".
+BRAWLER_COLUMNS = {
+    "trophies": ("trophies", np.int16),
+    "power": ("power", np.uint8),
+    "rank": ("rank", np.uint8),
+    "max_win_streak": ("maxWinStreak", np.int16),
+    "current_win_streak": ("currentWinStreak", np.int16),
+}
+
+
+class PlayerTable:
+    """
+    Columnar in-memory table of players for population-scale queries.
+
+    Player-level stats live in one NumPy array per column; per-brawler stats
+    live in dense player × brawler matrices whose columns are assigned as new
+    brawler ids are seen. Rows are appended with `add` / `extend` from `Player`
+    models or raw API payloads (the latter skip pydantic entirely).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = capacity
+        self._size = 0
+        self.tags: list[str] = []
+        self.columns = {
+            name: np.zeros(capacity, dtype) for name, (_, dtype) in PLAYER_COLUMNS.items()
+        }
+        self.brawler_ids: list[int] = []
+        self._brawler_index: dict[int, int] = {}
+        self.matrices = {
+            name: np.zeros((capacity, 0), dtype)
+            for name, (_, dtype) in BRAWLER_COLUMNS.items()
+        }
+        self._tag_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ──────────────────────────────────────────────────────────────
+    # Ingestion
+    # ──────────────────────────────────────────────────────────────
+
+    def _grow_rows(self) -> None:
+        self._capacity *= 2
+        for name, column in self.columns.items():
+            self.columns[name] = np.resize(column, self._capacity)
+            self.columns[name][self._size :] = 0
+        for name, matrix in self.matrices.items():
+            grown = np.zeros((self._capacity, matrix.shape[1]), matrix.dtype)
+            grown[: self._size] = matrix[: self._size]
+            self.matrices[name] = grown
+
+    def _brawler_column(self, brawler_id: int) -> int:
+        if (index := self._brawler_index.get(brawler_id)) is not None:
+            return index
+
+        index = self._brawler_index[brawler_id] = len(self.brawler_ids)
+        self.brawler_ids.append(brawler_id)
+        for name, matrix in self.matrices.items():
+            # Grow brawler columns in chunks to avoid a copy per new brawler
+            if index >= matrix.shape[1]:
+                grown = np.zeros((self._capacity, matrix.shape[1] + 16), matrix.dtype)
+                grown[:, : matrix.shape[1]] = matrix
+                self.matrices[name] = grown
+        return index
+
+    def add(self, player: Player | dict[str, Any]) -> int:
+        """Adds (or replaces, by tag) a player and returns its row index."""
+        if isinstance(player, Player):
+            tag = player.tag
+            values = {name: getattr(player, name) for name in PLAYER_COLUMNS}
+            brawlers = [
+                (b.id, {name: getattr(b, name) for name in BRAWLER_COLUMNS})
+                for b in player.brawlers
+            ]
+        else:
+            tag = player["tag"]
+            values = {
+                name: player.get(key, 0) for name, (key, _) in PLAYER_COLUMNS.items()
+            }
+            brawlers = [
+                (b["id"], {name: b.get(key, 0) for name, (key, _) in BRAWLER_COLUMNS.items()})
+                for b in player.get("brawlers", ())
+            ]
+
+        if (row := self._tag_index.get(tag)) is None:
+            if self._size == self._capacity:
+                self._grow_rows()
+            row = self._tag_index[tag] = self._size
+            self.tags.append(tag)
+            self._size += 1
+        else:
+            for matrix in self.matrices.values():
+                matrix[row] = 0
+
+        for name, value in values.items():
+            self.columns[name][row] = value
+
+        for brawler_id, stats in brawlers:
+            col = self._brawler_column(brawler_id)
+            for name, value in stats.items():
+                self.matrices[name][row, col] = value
+        return row
+
+    def extend(self, players: Iterable[Player | dict[str, Any]]) -> None:
+        for player in players:
+            self.add(player)
+
+    # ──────────────────────────────────────────────────────────────
+    # Column access
+    # ──────────────────────────────────────────────────────────────
+
+    def column(self, name: str) -> np.ndarray:
+        """A player-level column, trimmed to the number of rows."""
+        return self.columns[name][: self._size]
+
+    def matrix(self, name: str) -> np.ndarray:
+        """A player × brawler matrix; columns follow `brawler_ids`."""
+        return self.matrices[name][: self._size, : len(self.brawler_ids)]
+
+    def brawler(self, brawler_id: int, name: str = "trophies") -> np.ndarray:
+        """One brawler's column of a matrix (zeros for players without it)."""
+        return self.matrix(name)[:, self._brawler_index[brawler_id]]
+
+    def owned(self) -> np.ndarray:
+        """Boolean player × brawler mask of unlocked brawlers."""
+        return self.matrix("power") > 0
+
+    def row(self, index: int) -> dict[str, Any]:
+        brawlers = {
+            brawler_id: {
+                name: int(self.matrices[name][index, col]) for name in BRAWLER_COLUMNS
+            }
+            for col, brawler_id in enumerate(self.brawler_ids)
+            if self.matrices["power"][index, col]
+        }
+        return {
+            "tag": self.tags[index],
+            **{name: int(column[index]) for name, column in self.columns.items()},
+            "brawlers": brawlers,
+        }
+
+    # ──────────────────────────────────────────────────────────────
+    # Queries
+    # ──────────────────────────────────────────────────────────────
+
+    def filter(self, mask: np.ndarray) -> np.ndarray:
+        """Row indices where `mask` is true, e.g. `t.filter(t.column("exp_level") > 200)`."""
+        return np.flatnonzero(mask)
+
+    def top_k(
+        self, k: int, by: str = "trophies", brawler_id: int | None = None
+    ) -> np.ndarray:
+        """Row indices of the `k` highest values, best first."""
+        values = self.column(by) if brawler_id is None else self.brawler(brawler_id, by)
+        k = min(k, len(values))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        top = np.argpartition(values, -k)[-k:]
+        return top[np.argsort(values[top])[::-1]]
+
+    def percentiles(
+        self,
+        q: float | Iterable[float] = (50, 90, 99),
+        field: str = "trophies",
+    ) -> dict[int, np.ndarray]:
+        """Per-brawler percentiles of `field` over the players who own the brawler."""
+        if not len(self):
+            return {}
+
+        values = self.matrix(field).astype(np.float64)
+        values[~self.owned()] = np.nan
+        result = np.nanpercentile(values, q, axis=0)
+        return {
+            brawler_id: result[..., col]
+            for col, brawler_id in enumerate(self.brawler_ids)
+        }
+
+    def brawler_stats(self) -> dict[str, np.ndarray]:
+        """
+        The aggregates `Player.compute_brawlers_stats` derives, for every row
+        at once: win streak values and brawler ids (-1 for none), trophies over
+        1000 and the trophy box id.
+        """
+        ids = np.asarray(self.brawler_ids, dtype=np.int64)
+        stats: dict[str, np.ndarray] = {}
+
+        for name in ("max_win_streak", "current_win_streak"):
+            matrix = self.matrix(name)
+            if matrix.shape[1] == 0:
+                stats[name] = np.zeros(len(self), np.int32)
+                stats[f"{name}_brawler_id"] = np.full(len(self), -1, np.int64)
+                continue
+            best = matrix.argmax(axis=1)
+            value = matrix[np.arange(len(self)), best].astype(np.int32)
+            stats[name] = value
+            stats[f"{name}_brawler_id"] = np.where(value > 0, ids[best], -1)
+
+        over = np.clip(self.matrix("trophies").astype(np.int32) - 1000, 0, None).sum(axis=1)
+        stats["trophies_over_1000"] = over
+        stats["trophies_box_id"] = np.select(
+            [over > 3000, over >= 1000, over >= 400, over >= 100], [5, 4, 3, 2], 1
+        )
+        return stats
@@ -1,29 +1,47 @@
+from __future__ import annotations
+
 import logging
-from typing import Any, Type, TypeVar
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import httpx
-from pydantic import BaseModel
 
 from brawldogg.exceptions import BadRequest
 
 from .constants import BASE_URL, ENDPOINTS
 from .http_client import HTTPClient
-from .models import (
-    BattleLogEntry,
-    Brawler,
-    Club,
-    ClubMember,
-    ClubRanking,
-    EventEntry,
-    GameMode,
-    PagingResponse,
-    Player,
-    PlayerRanking,
-)
+from .models.registry import get_adapter
+from .utils.admission import AdmissionPolicy
+from .utils.cache import TTLCache
+from .utils.hedging import HedgingPolicy
+from .utils.parse_pool import ParsePool
+from .utils.quota import QuotaTracker
+from .utils.retry import RetryPolicy
 from .utils.tag_parser import normalize_tag
 
+if TYPE_CHECKING:
+    from .models import (
+        BattleLogEntry,
+        Brawler,
+        Club,
+        ClubMember,
+        ClubRanking,
+        EventEntry,
+        GameMode,
+        PagingResponse,
+        Player,
+        PlayerRanking,
+    )
+
 log = logging.getLogger("brawldogg")
-T = TypeVar("T", bound=BaseModel)
+
+
+class Polled(NamedTuple):
+    """A fetched model and whether its raw body was identical to the previous fetch."""
+
+    model: Any
+    unchanged: bool
 
 
 class BrawlStarsClient(HTTPClient):
@@ -43,6 +61,17 @@ class BrawlStarsClient(HTTPClient):
         max_retries: int = 3,
         session: httpx.AsyncClient | None = None,
         base_url: str = BASE_URL,
+        retry_policy: RetryPolicy | None = None,
+        breaker_threshold: int = 5,
+        breaker_recovery: float = 30.0,
+        hedging: HedgingPolicy | None = None,
+        route_concurrency: dict[str, int] | None = None,
+        negative_ttls: dict[int, int] | None = None,
+        record_to: str | Path | None = None,
+        admission: AdmissionPolicy | None = None,
+        quota: QuotaTracker | None = None,
+        parse_pool: ParsePool | None = None,
+        reuse_unchanged: bool = False,
     ):
         super().__init__(
             token,
@@ -51,67 +80,98 @@ class BrawlStarsClient(HTTPClient):
             max_retries=max_retries,
             session=session,
             base_url=base_url,
+            retry_policy=retry_policy,
+            breaker_threshold=breaker_threshold,
+            breaker_recovery=breaker_recovery,
+            hedging=hedging,
+            route_concurrency=route_concurrency,
+            negative_ttls=negative_ttls,
+            record_to=record_to,
+            admission=admission,
+            quota=quota,
         )
+        # Opt-in: decode and validate responses in worker processes/threads
+        self.parse_pool = parse_pool
+        # Opt-in: return the previous model instance when the raw body is identical
+        self.reuse_unchanged = reuse_unchanged
+        # cache key → (body digest, model) of the last parsed body
+        self.parsed_bodies = TTLCache(60 * 60, maxsize=10_000)
+        self.unchanged_hits = 0
 
     # ──────────────────────────────────────────────────────────────
     # Internal Fetchers (Refactored Logic)
     # ──────────────────────────────────────────────────────────────
 
-    async def _fetch_single_endpoint(
-        self,
-        endpoint_key: str,
-        model: Type[T],
-        path_params: dict[str, Any] | None = None,
-        query_params: dict[str, Any] | None = None,
-        cache_ttl: int | None = None,
-    ) -> T:
-        """Helper for fetching a single object (e.g., Player, Club)."""
-        endpoint = ENDPOINTS[endpoint_key].format(**(path_params or {}))
-
-        data = await self._request(
-            "GET", endpoint, params=query_params, cache_ttl=cache_ttl
-        )
-
-        return model.model_validate(data)
-
-    async def _fetch_paged_endpoint(
+    async def _fetch_endpoint(
         self,
         endpoint_key: str,
-        model: Type[T],
         path_params: dict[str, Any] | None = None,
         query_params: dict[str, Any] | None = None,
         cache_ttl: int | None = None,
-    ) -> PagingResponse[T]:
+        refresh: bool = False,
+    ) -> Any:
         """
-        Helper for fetching a list of objects from a paginated endpoint.
-        Returns the PagingResponse model, parameterized by the model.
+        Fetches an endpoint and validates the whole payload (single object,
+        paged response or list) with the endpoint's precompiled validator.
         """
+        if self.reuse_unchanged:
+            polled = await self._fetch_polled(
+                endpoint_key, path_params, query_params, cache_ttl, refresh
+            )
+            return polled.model
+
         endpoint = ENDPOINTS[endpoint_key].format(**(path_params or {}))
 
         data = await self._request(
-            "GET", endpoint, params=query_params, cache_ttl=cache_ttl
+            "GET",
+            endpoint,
+            params=query_params,
+            cache_ttl=cache_ttl,
+            route=endpoint_key,
+            decode=self.parse_pool is None,
+            refresh=refresh,
         )
 
-        return PagingResponse[model].model_validate(data)
+        if self.parse_pool is not None:
+            return await self.parse_pool.parse(endpoint_key, data)
+        return get_adapter(endpoint_key).validate_python(data)
 
-    async def _fetch_list_endpoint(
+    async def _fetch_polled(
         self,
         endpoint_key: str,
-        model: Type[T],
         path_params: dict[str, Any] | None = None,
         query_params: dict[str, Any] | None = None,
         cache_ttl: int | None = None,
-    ) -> list[T]:
+        refresh: bool = False,
+    ) -> Polled:
         """
-        Helper for fetching a list of objects from an endpoint.
+        Fetches the raw body and skips validation when its digest matches the
+        last body parsed for the same request, returning that model instead.
         """
         endpoint = ENDPOINTS[endpoint_key].format(**(path_params or {}))
 
-        data = await self._request(
-            "GET", endpoint, params=query_params, cache_ttl=cache_ttl
+        body = await self._request(
+            "GET",
+            endpoint,
+            params=query_params,
+            cache_ttl=cache_ttl,
+            route=endpoint_key,
+            decode=False,
+            refresh=refresh,
         )
 
-        return [model.model_validate(item) for item in data]
+        key = self._generate_cache_key("GET", endpoint, query_params)
+        digest = blake2b(body, digest_size=16).digest()
+        if (last := self.parsed_bodies.get(key)) is not None and last[0] == digest:
+            self.unchanged_hits += 1
+            return Polled(last[1], True)
+
+        if self.parse_pool is not None:
+            model = await self.parse_pool.parse(endpoint_key, body)
+        else:
+            model = get_adapter(endpoint_key).validate_json(body)
+        self.parsed_bodies[key] = (digest, model)
+        return Polled(model, False)
 
     # ──────────────────────────────────────────────────────────────
     # Query helpers
@@ -145,26 +205,41 @@ class BrawlStarsClient(HTTPClient):
     # Public API Methods (Simplified)
     # ──────────────────────────────────────────────────────────────
 
+    async def poll(
+        self,
+        endpoint_key: str,
+        *,
+        path_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+        refresh: bool = False,
+    ) -> Polled:
+        """
+        Fetches any endpoint (by ENDPOINTS key) and reports whether the body
+        was byte-identical to the previous poll of the same request. Unchanged
+        bodies are not re-validated: the previous model instance is returned.
+        """
+        if path_params and "tag" in path_params:
+            path_params = {**path_params, "tag": normalize_tag(path_params["tag"])}
+        return await self._fetch_polled(
+            endpoint_key, path_params, query_params, refresh=refresh
+        )
+
     # Player Methods
     async def get_player(self, tag: str) -> Player:
         """Retrieve player information by tag."""
         tag = normalize_tag(tag)
-        return await self._fetch_single_endpoint(
-            "player", Player, path_params={"tag": tag}
-        )
+        return await self._fetch_endpoint("player", path_params={"tag": tag})
 
     async def get_player_battlelog(self, tag: str) -> PagingResponse[BattleLogEntry]:
         """Retrieve a player's recent battle log."""
         tag = normalize_tag(tag)
-        return await self._fetch_paged_endpoint(
-            "battlelog", BattleLogEntry, path_params={"tag": tag}
-        )
+        return await self._fetch_endpoint("battlelog", path_params={"tag": tag})
 
     # Club Methods
     async def get_club(self, tag: str) -> Club:
         """Retrieve club information by tag."""
         tag = normalize_tag(tag)
-        return await self._fetch_single_endpoint("club", Club, path_params={"tag": tag})
+        return await self._fetch_endpoint("club", path_params={"tag": tag})
 
     async def get_club_members(
         self,
@@ -179,9 +254,8 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
+        return await self._fetch_endpoint(
             "club_members",
-            ClubMember,
             path_params={"tag": tag},
             query_params=query_params,
         )
@@ -198,17 +272,16 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
-            "gamemodes", GameMode, query_params=query_params, cache_ttl=60 * 60 * 24
+        return await self._fetch_endpoint(
+            "gamemodes", query_params=query_params, cache_ttl=60 * 60 * 24
         )
 
-    async def get_current_events(self) -> list[EventEntry]:
-        """Retrieve the current events map rotation."""
-        return await self._fetch_list_endpoint(
-            "events",
-            EventEntry,
-            cache_ttl=60 * 60,
-        )
+    async def get_current_events(self, *, refresh: bool = False) -> list[EventEntry]:
+        """
+        Retrieve the current events map rotation.
+        Cached until the earliest event ends (at most an hour if no end time).
+        """
+        return await self._fetch_endpoint("events", cache_ttl=60 * 60, refresh=refresh)
 
     async def get_brawlers(
         self,
@@ -221,14 +294,14 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
-            "brawlers", Brawler, query_params=query_params, cache_ttl=60 * 60 * 24
+        return await self._fetch_endpoint(
+            "brawlers", query_params=query_params, cache_ttl=60 * 60 * 24
         )
 
     async def get_brawler(self, brawler_id: int) -> Brawler:
         """Retrieve information for a specific brawler by ID."""
-        return await self._fetch_single_endpoint(
-            "brawler", Brawler, path_params={"id": brawler_id}, cache_ttl=60 * 60 * 24
+        return await self._fetch_endpoint(
+            "brawler", path_params={"id": brawler_id}, cache_ttl=60 * 60 * 24
         )
 
     # Rankings Methods
@@ -244,9 +317,8 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
+        return await self._fetch_endpoint(
             "rankings_players",
-            PlayerRanking,
             path_params={"country": country},
             query_params=query_params,
         )
@@ -263,9 +335,8 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
+        return await self._fetch_endpoint(
             "rankings_clubs",
-            ClubRanking,
             path_params={"country": country},
             query_params=query_params,
         )
@@ -283,9 +354,8 @@ class BrawlStarsClient(HTTPClient):
         query_params = self._build_query_(limit, after, before)
         self._validate_query(query_params)
 
-        return await self._fetch_paged_endpoint(
+        return await self._fetch_endpoint(
             "rankings_brawlers",
-            PlayerRanking,
             path_params={"country": country, "id": brawler_id},
             query_params=query_params,
         )
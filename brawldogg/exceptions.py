@@ -46,3 +46,47 @@ class Unavailable(HTTPException):
 
     def __init__(self, reason: str, message: str) -> None:
         super().__init__(503, reason, message)
+
+
+class NetworkError(HTTPException):
+    """Raised when the request failed before a response was received (timeout, connection reset)."""
+
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(0, reason, message)
+
+
+class CircuitOpen(Unavailable):
+    """Raised when an endpoint's circuit breaker is open and the request is failed fast."""
+
+
+def exception_for_status(status: int, reason: str, message: str) -> HTTPException:
+    """Builds the typed exception matching an API status code."""
+    match status:
+        case 400:
+            return BadRequest(reason, message)
+        case 403:
+            return AccessDenied(reason, message)
+        case 404:
+            return NotFound(reason, message)
+        case 429:
+            return RateLimited(reason, message)
+        case 500:
+            return InternalServerError(reason, message)
+        case 503:
+            return Unavailable(reason, message)
+        case _:
+            return HTTPException(status, reason, message)
+
+
+class DeadlineExceeded(HTTPException):
+    """Raised when a request can't complete within its deadline (see `utils.deadline`)."""
+
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(0, reason, message)
+
+
+class Overloaded(HTTPException):
+    """Raised when a request is shed by admission control instead of being queued."""
+
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(0, reason, message)
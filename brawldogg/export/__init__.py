@@ -0,0 +1,12 @@
+from .pipeline import ExportPipeline, ExportStats, flatten_result
+from .sinks import NDJSONSink, ParquetSink, Sink, SQLiteSink
+
+__all__ = [
+    "ExportPipeline",
+    "ExportStats",
+    "flatten_result",
+    "Sink",
+    "NDJSONSink",
+    "SQLiteSink",
+    "ParquetSink",
+]
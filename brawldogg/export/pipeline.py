@@ -0,0 +1,182 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterable, Awaitable, Callable, Generic, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from ..exceptions import HTTPException
+from ..models.paging import PagingResponse
+from .sinks import Sink
+
+log = logging.getLogger("brawldogg.export")
+
+K = TypeVar("K")
+
+_DONE = object()
+
+
+def flatten_result(key: Any, result: Any) -> list[dict[str, Any]]:
+    """
+    Default transform: turns a fetcher result into records.
+
+    Paged responses and lists yield one record per item. Every record gets
+    `_key` (the fetched key) and `_kind` (the model name) fields.
+    """
+    if isinstance(result, PagingResponse):
+        items = result.items
+    elif isinstance(result, list):
+        items = result
+    else:
+        items = [result]
+
+    records = []
+    for item in items:
+        record = item.model_dump(mode="json") if isinstance(item, BaseModel) else item
+        record["_key"] = str(key)
+        record["_kind"] = type(item).__name__
+        records.append(record)
+    return records
+
+
+class ExportStats:
+    def __init__(self):
+        self.fetched = 0
+        self.written = 0
+        self.batches = 0
+        self.failed: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"ExportStats(fetched={self.fetched}, written={self.written}, "
+            f"batches={self.batches}, failed={self.failed})"
+        )
+
+
+class ExportPipeline(Generic[K]):
+    """
+    Streams fetcher results into a sink with bounded memory.
+
+    `fetch` is any coroutine function taking a key, e.g. `client.get_player`.
+    Keys are pulled lazily from the (async) iterable by `concurrency` workers;
+    records go through a bounded queue to a single writer that flushes every
+    `batch_size` records or `flush_interval` seconds. When the sink falls
+    behind, the queue fills up and workers block, so memory stays flat
+    regardless of job size.
+
+    API errors (`HTTPException`, e.g. NotFound for a dead tag), malformed
+    keys and payloads that fail validation (`ValueError`, which includes
+    pydantic's `ValidationError`) are counted in `stats.failed` and skipped
+    unless `skip_errors` is False.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[K], Awaitable[Any]],
+        sink: Sink,
+        *,
+        concurrency: int = 8,
+        batch_size: int = 500,
+        max_pending: int | None = None,
+        flush_interval: float = 5.0,
+        transform: Callable[[K, Any], list[dict[str, Any]]] = flatten_result,
+        skip_errors: bool = True,
+    ):
+        self.fetch = fetch
+        self.sink = sink
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.max_pending = max_pending or batch_size * 2
+        self.flush_interval = flush_interval
+        self.transform = transform
+        self.skip_errors = skip_errors
+        self.stats = ExportStats()
+
+    async def run(self, keys: Iterable[K] | AsyncIterable[K]) -> ExportStats:
+        key_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        record_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+
+        producer = asyncio.create_task(self._produce(keys, key_queue))
+        workers = [
+            asyncio.create_task(self._work(key_queue, record_queue))
+            for _ in range(self.concurrency)
+        ]
+        writer = asyncio.create_task(self._write(record_queue))
+
+        async def feed():
+            await producer
+            await asyncio.gather(*workers)
+            await record_queue.put(_DONE)
+
+        try:
+            # gather fails fast if either side raises, so a broken sink can't
+            # leave workers blocked on a full queue
+            await asyncio.gather(feed(), writer)
+        finally:
+            tasks = (producer, *workers, writer)
+            for task in tasks:
+                task.cancel()
+            # The sink is closed after run() returns; let cancellations settle first
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self.stats
+
+    async def _produce(self, keys: Iterable[K] | AsyncIterable[K], queue: asyncio.Queue):
+        if isinstance(keys, AsyncIterable):
+            async for key in keys:
+                await queue.put(key)
+        else:
+            for key in keys:
+                await queue.put(key)
+
+        for _ in range(self.concurrency):
+            await queue.put(_DONE)
+
+    async def _work(self, keys: asyncio.Queue, records: asyncio.Queue):
+        while (key := await keys.get()) is not _DONE:
+            try:
+                result = await self.fetch(key)
+                records_out = self.transform(key, result)
+            except (HTTPException, ValueError) as e:
+                # ValueError covers malformed keys (normalize_tag) and payloads
+                # that fail validation (pydantic's ValidationError)
+                if not self.skip_errors:
+                    raise
+                name = type(e).__name__
+                self.stats.failed[name] = self.stats.failed.get(name, 0) + 1
+                log.debug(f"Export skipped {key!r}: {e}")
+                continue
+
+            self.stats.fetched += 1
+            for record in records_out:
+                # Blocks while the writer is behind (backpressure)
+                await records.put(record)
+
+    async def _write(self, records: asyncio.Queue):
+        batch: list[dict[str, Any]] = []
+        done = False
+
+        while not done:
+            try:
+                record = await asyncio.wait_for(records.get(), self.flush_interval)
+            except asyncio.TimeoutError:
+                record = None
+
+            if record is _DONE:
+                done = True
+            elif record is not None:
+                batch.append(record)
+                if len(batch) < self.batch_size:
+                    continue
+
+            if batch:
+                # Cancelling the await wouldn't stop a write running in a
+                # thread, so wait for it before the sink can be closed
+                write = asyncio.ensure_future(self.sink.write_batch(batch))
+                try:
+                    await asyncio.shield(write)
+                except asyncio.CancelledError:
+                    await asyncio.gather(write, return_exceptions=True)
+                    raise
+                self.stats.written += len(batch)
+                self.stats.batches += 1
+                batch = []
@@ -0,0 +1,182 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Self
+
+
+class Sink(ABC):
+    """
+    Base class for export sinks.
+
+    Sinks receive records (JSON-compatible dicts) in batches. Blocking file
+    and database I/O runs in a worker thread so the event loop keeps fetching.
+    """
+
+    async def write_batch(self, records: list[dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._write_batch, records)
+
+    @abstractmethod
+    def _write_batch(self, records: list[dict[str, Any]]) -> None: ...
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    def _close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class NDJSONSink(Sink):
+    """Appends one JSON document per line."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def _write_batch(self, records: list[dict[str, Any]]) -> None:
+        self._file.writelines(
+            json.dumps(record, separators=(",", ":"), default=str) + "\n"
+            for record in records
+        )
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class SQLiteSink(Sink):
+    """
+    Inserts records into a SQLite table, one transaction per batch.
+
+    Each row stores the export key, the record kind, the fetch time and the
+    record itself as JSON (queryable with SQLite's JSON functions).
+    """
+
+    def __init__(self, path: str | Path, table: str = "records"):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+
+        self.path = Path(path)
+        self.table = table
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT, kind TEXT, fetched_at REAL, data TEXT)"
+        )
+        self._conn.commit()
+
+    def _write_batch(self, records: list[dict[str, Any]]) -> None:
+        now = time.time()
+        rows = [
+            (
+                record.get("_key"),
+                record.get("_kind"),
+                now,
+                json.dumps(record, separators=(",", ":"), default=str),
+            )
+            for record in records
+        ]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO {self.table} VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _close(self) -> None:
+        self._conn.close()
+
+
+class ParquetSink(Sink):
+    """
+    Writes record batches as Parquet row groups. Requires `pyarrow`.
+
+    With an explicit `schema`, every batch is cast to it and a batch that
+    doesn't fit raises `ValueError`. Otherwise the schema is inferred from the
+    first batch. Later batches missing some columns are padded with nulls.
+    A batch that adds columns or gives a type to a column that was all-null
+    so far starts a new part file (`<stem>-1.parquet`, ...) with the unified
+    schema, so no data is dropped; `paths` lists the files written.
+    """
+
+    def __init__(self, path: str | Path, schema: Any = None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "ParquetSink requires pyarrow: pip install pyarrow"
+            ) from e
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = Path(path)
+        self.schema = schema
+        self.paths: list[Path] = []
+        self._writer = None
+
+    def _open(self, schema: Any) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        part = len(self.paths)
+        path = (
+            self.path
+            if part == 0
+            else self.path.with_name(f"{self.path.stem}-{part}{self.path.suffix}")
+        )
+        self._writer = self._pq.ParquetWriter(path, schema)
+        self.paths.append(path)
+
+    def _conform(self, table: Any, schema: Any) -> Any:
+        """`table` cast to `schema` (missing columns as nulls), or None if it doesn't fit."""
+        pa = self._pa
+        if not set(table.column_names) <= set(schema.names):
+            return None
+        try:
+            columns = [
+                table.column(field.name).cast(field.type)
+                if field.name in table.column_names
+                else pa.nulls(table.num_rows, field.type)
+                for field in schema
+            ]
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return None
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _write_batch(self, records: list[dict[str, Any]]) -> None:
+        pa = self._pa
+        if self.schema is not None:
+            if self._writer is None:
+                self._open(self.schema)
+            table = self._conform(pa.Table.from_pylist(records), self.schema)
+            if table is None:
+                raise ValueError("Batch doesn't match the ParquetSink schema")
+            self._writer.write_table(table)
+            return
+
+        table = pa.Table.from_pylist(records)
+        if self._writer is None:
+            self._open(table.schema)
+        elif (conformed := self._conform(table, self._writer.schema)) is not None:
+            table = conformed
+        else:
+            # Schema drift: continue in a new part file with the unified schema
+            unified = pa.unify_schemas(
+                [self._writer.schema, table.schema], promote_options="permissive"
+            )
+            self._open(unified)
+            table = self._conform(table, unified)
+            if table is None:
+                raise ValueError("Batch can't be unified with the ParquetSink schema")
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -0,0 +1,8 @@
+from .store import BRAWLER_FIELDS, PLAYER_FIELDS, Series, SnapshotStore
+
+__all__ = [
+    "SnapshotStore",
+    "Series",
+    "PLAYER_FIELDS",
+    "BRAWLER_FIELDS",
+]
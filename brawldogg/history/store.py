@@ -0,0 +1,277 @@
+import sqlite3
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..models.player import Player
+
+PLAYER_FIELDS = (
+    "trophies",
+    "highest_trophies",
+    "exp_level",
+    "exp_points",
+    "victories_3vs3",
+    "solo_victories",
+    "duo_victories",
+    "best_robo_rumble_time",
+    "best_time_as_big_brawler",
+)
+
+# Points per stored chunk; only the last, unsealed chunk of a series is rewritten
+CHUNK_POINTS = 64
+
+BRAWLER_FIELDS = (
+    "trophies",
+    "highest_trophies",
+    "power",
+    "rank",
+    "max_win_streak",
+    "current_win_streak",
+)
+
+
+def _timestamp(value: datetime | float | int | None) -> int:
+    if value is None:
+        return int(time.time())
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+
+def _encode(values: array) -> bytes:
+    """Delta-encodes an int64 array and compresses it."""
+    deltas = array("q", values)
+    for i in range(len(deltas) - 1, 0, -1):
+        deltas[i] -= deltas[i - 1]
+    return zlib.compress(deltas.tobytes())
+
+
+def _decode(blob: bytes) -> array:
+    values = array("q")
+    values.frombytes(zlib.decompress(blob))
+    for i in range(1, len(values)):
+        values[i] += values[i - 1]
+    return values
+
+
+class Series:
+    """A change-point series: `values[i]` holds from `times[i]` until `times[i + 1]`."""
+
+    def __init__(self, times: array | None = None, values: array | None = None):
+        self.times = times if times is not None else array("q")
+        self.values = values if values is not None else array("q")
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def last(self) -> int | None:
+        return self.values[-1] if self.values else None
+
+    def value_at(self, ts: int) -> int | None:
+        index = bisect_right(self.times, ts) - 1
+        return self.values[index] if index >= 0 else None
+
+    def between(self, since: int, until: int) -> list[tuple[int, int]]:
+        """Change points in [since, until], led by the value in effect at `since`."""
+        start = bisect_left(self.times, since)
+        end = bisect_right(self.times, until)
+        points = list(zip(self.times[start:end], self.values[start:end]))
+        if start > 0 and (not points or points[0][0] != since):
+            points.insert(0, (since, self.values[start - 1]))
+        return points
+
+
+class SnapshotStore:
+    """
+    Compact time-series store for `Player` snapshots.
+
+    Only changes are stored: each integer field of the player, and of each of
+    its brawlers, is kept as a change-point series (delta-encoded, compressed
+    int64 arrays) and a new point is appended only when the polled value
+    differs from the last one. Range queries decode just the series involved,
+    never full snapshots.
+
+    Series are stored in chunks of `CHUNK_POINTS` points. A new point only
+    rewrites the series' last chunk, so write cost doesn't grow with history
+    length. Up to `cache_size` tags are kept decoded in memory (LRU).
+    """
+
+    def __init__(self, path: str | Path = ":memory:", *, cache_size: int = 10_000):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "tag TEXT, field TEXT, chunk_start INTEGER, times BLOB, vals BLOB, "
+            "PRIMARY KEY (tag, field, chunk_start)) WITHOUT ROWID"
+        )
+        self._migrate()
+        self._conn.commit()
+        self.cache_size = cache_size
+        # Recently used series per tag, loaded on first use
+        self._series: OrderedDict[str, dict[str, Series]] = OrderedDict()
+
+    def _migrate(self) -> None:
+        """Splits whole-series rows of the previous layout into chunks."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'series'"
+        ).fetchone()
+        if not exists:
+            return
+        with self._conn:
+            for tag, field, times, vals in self._conn.execute(
+                "SELECT tag, field, times, vals FROM series"
+            ).fetchall():
+                series = Series(_decode(times), _decode(vals))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                    [
+                        self._chunk_row(tag, field, series, start)
+                        for start in range(0, len(series), CHUNK_POINTS)
+                    ],
+                )
+            self._conn.execute("DROP TABLE series")
+
+    @staticmethod
+    def _chunk_row(tag: str, field: str, series: Series, start: int) -> tuple:
+        end = start + CHUNK_POINTS
+        return (
+            tag,
+            field,
+            series.times[start],
+            _encode(series.times[start:end]),
+            _encode(series.values[start:end]),
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _load(self, tag: str) -> dict[str, Series]:
+        if (series := self._series.get(tag)) is not None:
+            self._series.move_to_end(tag)
+            return series
+
+        series = {}
+        rows = self._conn.execute(
+            "SELECT field, times, vals FROM chunks WHERE tag = ? "
+            "ORDER BY field, chunk_start",
+            (tag,),
+        )
+        for field, times, vals in rows:
+            if (current := series.get(field)) is None:
+                current = series[field] = Series()
+            current.times.extend(_decode(times))
+            current.values.extend(_decode(vals))
+
+        self._series[tag] = series
+        if len(self._series) > self.cache_size:
+            self._series.popitem(last=False)
+        return series
+
+    @staticmethod
+    def _flatten(player: Player) -> dict[str, int]:
+        fields = {name: getattr(player, name) for name in PLAYER_FIELDS}
+        for brawler in player.brawlers:
+            for name in BRAWLER_FIELDS:
+                fields[f"b:{brawler.id}:{name}"] = getattr(brawler, name)
+        return fields
+
+    def record(self, player: Player, at: datetime | float | None = None) -> int:
+        """Stores a snapshot and returns how many fields changed."""
+        ts = _timestamp(at)
+        series = self._load(player.tag)
+
+        # Validate the whole snapshot before touching the in-memory series
+        changes = []
+        for field, value in self._flatten(player).items():
+            current = series.get(field)
+            if current is not None and current.last == value:
+                continue
+            if current is not None and current.times and ts <= current.times[-1]:
+                raise ValueError(
+                    f"Snapshot for {player.tag} at {ts} is not newer than the last one"
+                )
+            changes.append((field, value))
+
+        for field, value in changes:
+            if (current := series.get(field)) is None:
+                current = series[field] = Series()
+            current.times.append(ts)
+            current.values.append(value)
+
+        if changes:
+            try:
+                with self._conn:
+                    # Each new point lands in (and only rewrites) the last chunk
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                        [
+                            self._chunk_row(
+                                player.tag,
+                                field,
+                                series[field],
+                                (len(series[field]) - 1) // CHUNK_POINTS * CHUNK_POINTS,
+                            )
+                            for field, _ in changes
+                        ],
+                    )
+            except Exception:
+                # Reload from the database next time rather than keep unsaved points
+                self._series.pop(player.tag, None)
+                raise
+        return len(changes)
+
+    def series(
+        self,
+        tag: str,
+        field: str = "trophies",
+        since: datetime | float | None = None,
+        until: datetime | float | None = None,
+    ) -> list[tuple[datetime, int]]:
+        """
+        Value history of a field, e.g. `series(tag, "trophies", since=month_ago)`.
+        Brawler fields are addressed as `b:<brawler_id>:<field>`.
+        """
+        if (current := self._load(tag).get(field)) is None:
+            return []
+
+        since_ts = _timestamp(since) if since is not None else 0
+        points = current.between(since_ts, _timestamp(until))
+        return [
+            (datetime.fromtimestamp(ts, tz=timezone.utc), value)
+            for ts, value in points
+        ]
+
+    def value_at(
+        self, tag: str, field: str, at: datetime | float | None = None
+    ) -> int | None:
+        if (current := self._load(tag).get(field)) is None:
+            return None
+        return current.value_at(_timestamp(at))
+
+    def brawler_deltas(
+        self,
+        tag: str,
+        since: datetime | float,
+        until: datetime | float | None = None,
+        field: str = "trophies",
+    ) -> dict[int, int]:
+        """Per-brawler change of `field` between two points in time."""
+        since_ts, until_ts = _timestamp(since), _timestamp(until)
+        deltas = {}
+        for key, current in self._load(tag).items():
+            if not key.startswith("b:") or not key.endswith(f":{field}"):
+                continue
+
+            end = current.value_at(until_ts)
+            if end is None:
+                continue
+            # Brawlers unlocked inside the window count from zero
+            start = current.value_at(since_ts) or 0
+            deltas[int(key.split(":")[1])] = end - start
+        return deltas
@@ -1,29 +1,47 @@
 import asyncio
+import json
 import logging
-from typing import Any, Literal, Self
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Literal, Self
 
 import httpx
 
 from .constants import BASE_URL
 from .exceptions import (
     AccessDenied,
-    BadRequest,
+    CircuitOpen,
+    DeadlineExceeded,
     HTTPException,
-    InternalServerError,
-    NotFound,
-    RateLimited,
-    Unavailable,
+    NetworkError,
+    Overloaded,
+    exception_for_status,
 )
+from .utils.admission import AdmissionPolicy
 from .utils.cache import TTLCache
+from .utils.deadline import remaining
+from .utils.expiry import EXPIRY_HOOKS, ExpiryHook
+from .utils.hedging import HedgingPolicy
+from .utils.negative_cache import NegativeCache
+from .utils.quota import QuotaTracker
+from .utils.replay import RecordingTransport
 from .utils.rate_limiter import RateLimiter
+from .utils.retry import CircuitBreaker, RetryPolicy
 
 log = logging.getLogger("brawldogg.http")
 
+_priority: ContextVar[str] = ContextVar("brawldogg_priority", default="normal")
+_MISSING = object()
+# Error statuses counted per token by the QuotaTracker
+_QUOTA_ERRORS = {403: "forbidden", 429: "rate_limited"}
+
 
 class HTTPClient:
     """
-    Core asynchronous HTTP client with token rotation, exponential backoff,
-    TTL caching, and rate limiting.
+    Core asynchronous HTTP client with token rotation, jittered retries,
+    per-endpoint circuit breaking, TTL caching, and rate limiting.
     """
 
     def __init__(
@@ -35,6 +53,15 @@ class HTTPClient:
         max_retries: int = 3,
         session: httpx.AsyncClient | None = None,
         base_url: str = BASE_URL,
+        retry_policy: RetryPolicy | None = None,
+        breaker_threshold: int = 5,
+        breaker_recovery: float = 30.0,
+        hedging: HedgingPolicy | None = None,
+        route_concurrency: dict[str, int] | None = None,
+        negative_ttls: dict[int, int] | None = None,
+        record_to: str | Path | None = None,
+        admission: AdmissionPolicy | None = None,
+        quota: QuotaTracker | None = None,
     ):
         self.tokens = [token] if isinstance(token, str) else token
         self.tokens = [t for t in self.tokens if t != ""]
@@ -46,21 +73,48 @@ class HTTPClient:
         self.max_retries = max_retries
         self.cache_ttl = cache_ttl
 
+        if record_to is not None and session is not None:
+            raise ValueError(
+                "record_to only applies to the client's own session; "
+                "wrap your transport in RecordingTransport instead"
+            )
+        self.record_to = record_to
         self._session = session
         self._owned_session = session is None
 
-        self.rate_limiter = RateLimiter()
-        self.cache = TTLCache(default_ttl=cache_ttl)
+        self.rate_limiter = RateLimiter(concurrency=route_concurrency)
+        self.admission = admission
+        self.cache = TTLCache(
+            default_ttl=cache_ttl,
+            stale_ttl=admission.stale_ttl if admission and admission.serve_stale else 0,
+        )
+        # Route → hook deriving a payload's intrinsic expiry (e.g. event end times)
+        self.expiry_hooks: dict[str, ExpiryHook] = dict(EXPIRY_HOOKS)
+        self.negative_cache = NegativeCache(
+            negative_ttls if negative_ttls is not None else {404: cache_ttl}
+        )
+
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self.breaker_threshold = breaker_threshold
+        self.breaker_recovery = breaker_recovery
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.hedging = hedging
+        self.quota = quota
 
         self._closed = False
 
     async def _get_session(self) -> httpx.AsyncClient:
         """Lazily create a session only if we own it."""
         if self._session is None:
+            transport = RecordingTransport(self.record_to) if self.record_to else None
             self._session = httpx.AsyncClient(
                 timeout=self.timeout,
+                transport=transport,
                 event_hooks={"response": [self._handle_response_hook]},
             )
+        elif self._handle_response_hook not in self._session.event_hooks["response"]:
+            # Injected sessions (e.g. with a ReplayTransport) need the error hook too
+            self._session.event_hooks["response"].append(self._handle_response_hook)
         return self._session
 
     async def _handle_response_hook(self, response: httpx.Response) -> None:
@@ -83,21 +137,21 @@ class HTTPClient:
         reason = data.get("reason", response.reason_phrase or "Unknown Error")
         message = data.get("message", data)
 
-        match status_code := response.status_code:
-            case 400:
-                raise BadRequest(reason, message)
-            case 403:
-                raise AccessDenied(reason, message)
-            case 404:
-                raise NotFound(reason, message)
-            case 429:
-                raise RateLimited(reason, message)
-            case 500:
-                raise InternalServerError(reason, message)
-            case 503:
-                raise Unavailable(reason, message)
-            case _:
-                raise HTTPException(status_code, reason, message)
+        raise exception_for_status(response.status_code, reason, message)
+
+    @contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Sets the rate-limiter lane for every request made inside the block,
+        e.g. `with client.priority("bulk"): ...` for background crawls.
+        """
+        if name not in self.rate_limiter.weights:
+            raise ValueError(f"Unknown priority lane: {name!r}")
+        reset = _priority.set(name)
+        try:
+            yield
+        finally:
+            _priority.reset(reset)
 
     def _generate_cache_key(
         self, method: str, url: str, params: dict[str, Any] | None
@@ -106,6 +160,161 @@ class HTTPClient:
         params_items = frozenset((params or {}).items())
         return f"{method}:{url}:{hash(params_items)}"
 
+    def _payload_expiry(self, route: str, data: Any, decode: bool) -> float | None:
+        """Timestamp at which a payload expires by its own content, if known."""
+        if (hook := self.expiry_hooks.get(route)) is None:
+            return None
+        try:
+            return hook(data if decode else json.loads(data))
+        except (KeyError, TypeError, ValueError) as e:
+            log.debug(f"Expiry hook for {route} failed: {e!r}")
+            return None
+
+    def _record_saved(self) -> None:
+        # Attributed to the token a first attempt would have used
+        if self.quota is not None:
+            self.quota.record(self.tokens[0], "cache_saved")
+
+    def _get_breaker(self, route: str) -> CircuitBreaker:
+        if (breaker := self.breakers.get(route)) is None:
+            breaker = self.breakers[route] = CircuitBreaker(
+                self.breaker_threshold, self.breaker_recovery
+            )
+        return breaker
+
+    @staticmethod
+    def _time_left(expires: float | None, route: str) -> float | None:
+        """Seconds left until `expires`; raises once the deadline has passed."""
+        if expires is None:
+            return None
+        if (left := expires - time.monotonic()) <= 0:
+            raise DeadlineExceeded("Deadline exceeded", f"No time left for {route}")
+        return left
+
+    def _attempt_timeout(self, left: float | None) -> httpx.Timeout | None:
+        """The session timeouts, shortened so an attempt can't outlive the deadline."""
+        if left is None:
+            return None
+        return httpx.Timeout(
+            connect=min(self.timeout.connect or left, left),
+            read=min(self.timeout.read or left, left),
+            write=min(self.timeout.write or left, left),
+            pool=min(self.timeout.pool or left, left),
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        attempt: int,
+        route: str,
+        timeout: httpx.Timeout | None = None,
+        hedge: bool = False,
+    ) -> httpx.Response:
+        """
+        Performs a single HTTP exchange. The token rotates with the attempt
+        number; a hedged copy uses the token after the primary's.
+        """
+        token = self.tokens[(attempt + hedge) % len(self.tokens)]
+        headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        # Only override the session's timeout when a deadline shortens it
+        extra = {} if timeout is None else {"timeout": timeout}
+
+        session = await self._get_session()
+        started = time.monotonic()
+        if self.quota is not None:
+            self.quota.record(token, "requests")
+        try:
+            response = await session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                # Lets transports (e.g. RecordingTransport) tell retries and hedges apart
+                extensions={"brawldogg": {"attempt": attempt, "hedge": hedge}},
+                **extra,
+            )
+        except HTTPException as e:
+            if self.quota is not None and e.status in _QUOTA_ERRORS:
+                self.quota.record(token, _QUOTA_ERRORS[e.status])
+            raise
+
+        # The hook handles exceptions. If we reach here, status is < 400.
+        if self.hedging:
+            self.hedging.record_latency(route, time.monotonic() - started)
+        return response
+
+    async def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        attempt: int,
+        route: str,
+        priority: str,
+        timeout: httpx.Timeout | None = None,
+    ) -> httpx.Response:
+        """
+        Sends the request, and if hedging is enabled for the route and the
+        response is slower than the route's hedge delay, races a second copy
+        on the next token. The first successful response wins.
+        """
+        if self.hedging:
+            self.hedging.record_request()
+        delay = self.hedging.delay_for(route) if self.hedging else None
+        if delay is None:
+            return await self._send(method, url, params, attempt, route, timeout)
+
+        primary = asyncio.create_task(
+            self._send(method, url, params, attempt, route, timeout)
+        )
+        pending: set[asyncio.Task] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not self.hedging.try_spend():
+                return await primary
+
+            # Hedges are real requests and must respect the rate limit, but
+            # waiting for a slot must not hold up a primary that answers first
+            acquire = asyncio.create_task(
+                self.rate_limiter.acquire(
+                    priority, timeout=timeout.read if timeout else None
+                )
+            )
+            try:
+                await asyncio.wait(
+                    {primary, acquire}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                acquire.cancel()
+            got_slot = (
+                acquire.done() and not acquire.cancelled() and acquire.exception() is None
+            )
+            if primary.done() or not got_slot:
+                return await primary
+            hedge = asyncio.create_task(
+                self._send(method, url, params, attempt, route, timeout, hedge=True)
+            )
+            pending.add(hedge)
+            log.debug(f"Hedging {method} {url} after {delay:.3f}s")
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedging.hedge_wins += 1
+                        return task.result()
+
+            # Both copies failed: surface the primary's error
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def _request(
         self,
         method: Literal["GET"],
@@ -114,64 +323,177 @@ class HTTPClient:
         *,
         params: dict[str, Any] | None = None,
         use_cache: bool = True,
+        route: str | None = None,
+        priority: str | None = None,
+        decode: bool = True,
+        deadline: float | None = None,
+        refresh: bool = False,
     ) -> Any:
+        """
+        Performs a GET with caching, rate limiting and retries.
+
+        Returns the decoded JSON payload, or the raw response body if
+        `decode` is False (raw bodies are cached separately).
+
+        `refresh` skips the cache lookup but still stores the new response;
+        known-dead resources keep failing from the negative cache.
+        `deadline` (seconds) bounds the whole call, together with any
+        enclosing `utils.deadline.deadline()` block; work that can't finish
+        in time raises `DeadlineExceeded` instead of queueing.
+        """
         if self._closed:
             raise RuntimeError("Client is closed")
 
         cache_ttl = cache_ttl if cache_ttl is not None else self.cache_ttl
         url = f"{self.base_url}{endpoint}"
         cache_key = self._generate_cache_key(method, url, params)
+        body_key = cache_key if decode else f"raw:{cache_key}"
+        route = route or endpoint
+        priority = priority or _priority.get()
 
         # 1. Cache HIT
-        if use_cache and cache_key in self.cache:
-            log.debug(f"Cache HIT → {cache_key}")
-            return self.cache[cache_key]
+        if use_cache and not refresh and body_key in self.cache:
+            log.debug(f"Cache HIT → {body_key}")
+            self._record_saved()
+            return self.cache[body_key]
+
+        # Known-dead resources (e.g. deleted tags) fail without a request
+        if use_cache and self.negative_cache:
+            if (cached_exc := self.negative_cache.get(cache_key)) is not None:
+                log.debug(f"Negative cache HIT → {cache_key}")
+                self._record_saved()
+                raise cached_exc
+
+        # Admission control: degrade to stale data or shed instead of queueing
+        if self.admission is not None:
+            if (reason := self.admission.check(self.rate_limiter, priority)) is not None:
+                if use_cache and self.admission.serve_stale:
+                    stale = self.cache.get_stale(body_key, _MISSING)
+                    if stale is not _MISSING:
+                        self.admission.record_degraded(priority)
+                        log.debug(f"Overloaded, serving stale → {body_key}")
+                        self._record_saved()
+                        return stale
+                self.admission.record_shed(priority)
+                raise Overloaded("Overloaded", reason)
+
+        budget = remaining()
+        if deadline is not None:
+            budget = deadline if budget is None else min(budget, deadline)
+        expires = None if budget is None else time.monotonic() + budget
+
+        policy = self.retry_policy
+        breaker = self._get_breaker(route)
+        delay = 0.0
+        slept = 0.0
+        last_exc: Exception | None = None
 
-        # 2. Rate limiting (pre-request wait)
-        await self.rate_limiter.acquire()
+        for attempt in range(policy.max_attempts):
+            # 2. Fail fast while the endpoint is degraded
+            if not breaker.allow():
+                raise CircuitOpen(
+                    "Circuit open",
+                    f"{route} is failing, retry in {breaker.retry_after():.1f}s",
+                )
 
-        attempt = 0
-        last_exc: Exception | None = None
+            # 3. Rate limiting (every attempt consumes a request slot)
+            left = self._time_left(expires, route)
+            if left is not None and self.rate_limiter.expected_wait(priority) > left:
+                raise DeadlineExceeded(
+                    "Deadline exceeded",
+                    f"Rate-limit wait for {route} exceeds the remaining {left:.3f}s",
+                )
+            try:
+                await self.rate_limiter.acquire(priority, timeout=left)
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(
+                    "Deadline exceeded", f"Timed out waiting for a rate-limit slot for {route}"
+                ) from None
 
-        for attempt in range(self.max_retries):
             # Token rotation logic
             token_index = attempt % len(self.tokens)
-            token = self.tokens[token_index]
-            headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
 
+            left = self._time_left(expires, route)
             try:
-                session = await self._get_session()
-                response = await session.request(
-                    method, url, headers=headers, params=params
-                )
-
-                # The hook handles exceptions. If we reach here, status is < 400.
-                data = response.json()
-
-                # 3. Cache MISS - store
+                async with self.rate_limiter.limit(route, left):
+                    response = await self._send_hedged(
+                        method,
+                        url,
+                        params,
+                        attempt,
+                        route,
+                        priority,
+                        self._attempt_timeout(left),
+                    )
+                breaker.record_success()
+                data = response.json() if decode else response.content
+
+                # 4. Cache MISS - store (until the payload's own expiry, if it has one)
                 if use_cache:
-                    self.cache.set(cache_key, data, cache_ttl)
-                    log.debug(f"Cache MISS → stored {cache_key}")
+                    expires_at = self._payload_expiry(route, data, decode)
+                    if expires_at is None:
+                        self.cache.set(body_key, data, cache_ttl)
+                    elif expires_at > time.time():
+                        self.cache.set(body_key, data, expires_at=expires_at)
+                    log.debug(f"Cache MISS → stored {body_key}")
                 return data
 
             except AccessDenied as e:
+                breaker.record_success()
                 last_exc = e
                 log.warning(
                     f"Token rotation: Token index {token_index} invalid (403). Trying next token."
                 )
                 # No sleep, try the next token immediately
+                continue
 
-            except RateLimited as e:
+            except HTTPException as e:
+                # Only 5xx responses count against the upstream's health
+                if e.status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+                if not policy.is_retryable(e):
+                    if use_cache:
+                        self.negative_cache.add(cache_key, e)
+                    raise e
                 last_exc = e
-                wait_time = 2**attempt  # Exponential backoff
-                log.warning(
-                    f"Rate limited (429). Backing off for {wait_time}s. Trying next token/retry."
-                )
-                await asyncio.sleep(wait_time)
 
-            except HTTPException as e:
-                # Catch non-retryable errors (400, 404, 500, etc.) and re-raise immediately.
-                raise e
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(
+                    "Deadline exceeded", f"Timed out waiting for a {route} concurrency slot"
+                ) from None
+
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if expires is not None and time.monotonic() >= expires:
+                    raise DeadlineExceeded(
+                        "Deadline exceeded", f"{route} timed out: {e!r}"
+                    ) from e
+                error = NetworkError(type(e).__name__, str(e) or repr(e))
+                if not policy.is_retryable(e):
+                    raise error from e
+                last_exc = error
+
+            if attempt + 1 >= policy.max_attempts:
+                break
+
+            delay = policy.next_delay(delay, last_exc)
+            if (left := self._time_left(expires, route)) is not None and delay >= left:
+                raise DeadlineExceeded(
+                    "Deadline exceeded",
+                    f"Backoff of {delay:.2f}s for {route} exceeds the remaining {left:.3f}s",
+                ) from last_exc
+            if policy.budget is not None and slept + delay > policy.budget:
+                log.warning(f"Retry budget of {policy.budget}s exhausted for {url}.")
+                break
+
+            log.warning(
+                f"{last_exc} on attempt {attempt + 1}. Backing off for {delay:.2f}s."
+            )
+            slept += delay
+            await asyncio.sleep(delay)
 
         # Final failure state
         if last_exc:
@@ -1,10 +1,40 @@
-from .battlelog import Battle, BattleBrawler, BattleLogEntry, BattlePlayer
-from .brawler import Brawler, BrawlerStat, Gadget, StarPower
-from .club import Club, ClubMember, ClubName
-from .events import Event, EventEntry, GameMode
-from .paging import PagingResponse
-from .player import Player, PlayerClub, PlayerIcon, WinStreak
-from .rankings import ClubRanking, PlayerRanking
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .battlelog import Battle, BattleBrawler, BattleLogEntry, BattlePlayer
+    from .brawler import Brawler, BrawlerStat, Gadget, StarPower
+    from .club import Club, ClubMember, ClubName
+    from .events import Event, EventEntry, GameMode
+    from .paging import PagingResponse
+    from .player import Player, PlayerClub, PlayerIcon, WinStreak
+    from .rankings import ClubRanking, PlayerRanking
+
+# Models are imported on first attribute access so that `import brawldogg`
+# doesn't pay for building every pydantic schema up front.
+_MODULES = {
+    "Player": "player",
+    "PlayerIcon": "player",
+    "PlayerClub": "player",
+    "WinStreak": "player",
+    "BattleLogEntry": "battlelog",
+    "Battle": "battlelog",
+    "BattlePlayer": "battlelog",
+    "BattleBrawler": "battlelog",
+    "Club": "club",
+    "ClubMember": "club",
+    "ClubName": "club",
+    "Event": "events",
+    "GameMode": "events",
+    "EventEntry": "events",
+    "Brawler": "brawler",
+    "Gadget": "brawler",
+    "StarPower": "brawler",
+    "BrawlerStat": "brawler",
+    "PlayerRanking": "rankings",
+    "ClubRanking": "rankings",
+    "PagingResponse": "paging",
+}
 
 __all__ = [
     "Player",
@@ -29,3 +59,15 @@ __all__ = [
     "ClubRanking",
     "PagingResponse",
 ]
+
+
+def __getattr__(name: str):
+    if (module := _MODULES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,34 @@
+from .battlelog import BattleLogEntry
+from .brawler import Brawler
+from .club import ClubMember
+from .events import GameMode
+from .paging import PagingResponse
+from .rankings import ClubRanking, PlayerRanking
+
+# Concrete page types for the endpoint validators. Parametrized generics like
+# PagingResponse[BattleLogEntry] can't be pickled (pickle looks the class up by
+# name), so pages validated in ParsePool worker processes couldn't be returned.
+
+
+class BattleLogPage(PagingResponse[BattleLogEntry]):
+    pass
+
+
+class ClubMemberPage(PagingResponse[ClubMember]):
+    pass
+
+
+class GameModePage(PagingResponse[GameMode]):
+    pass
+
+
+class BrawlerPage(PagingResponse[Brawler]):
+    pass
+
+
+class PlayerRankingPage(PagingResponse[PlayerRanking]):
+    pass
+
+
+class ClubRankingPage(PagingResponse[ClubRanking]):
+    pass
@@ -0,0 +1,62 @@
+from functools import cache
+from typing import Any, Iterable
+
+from pydantic import TypeAdapter
+
+from ..constants import ENDPOINTS
+
+
+def _endpoint_type(endpoint_key: str) -> Any:
+    """The type an endpoint's JSON payload validates into."""
+    # Imported here so that importing brawldogg doesn't build every schema
+    from .brawler import Brawler
+    from .club import Club
+    from .events import EventEntry
+    from .pages import (
+        BattleLogPage,
+        BrawlerPage,
+        ClubMemberPage,
+        ClubRankingPage,
+        GameModePage,
+        PlayerRankingPage,
+    )
+    from .player import Player
+
+    match endpoint_key:
+        case "player":
+            return Player
+        case "battlelog":
+            return BattleLogPage
+        case "club":
+            return Club
+        case "club_members":
+            return ClubMemberPage
+        case "gamemodes":
+            return GameModePage
+        case "events":
+            return list[EventEntry]
+        case "brawlers":
+            return BrawlerPage
+        case "brawler":
+            return Brawler
+        case "rankings_players" | "rankings_brawlers":
+            return PlayerRankingPage
+        case "rankings_clubs":
+            return ClubRankingPage
+        case _:
+            raise KeyError(f"No model registered for endpoint {endpoint_key!r}")
+
+
+@cache
+def get_adapter(endpoint_key: str) -> TypeAdapter:
+    """
+    Returns the validator for an `ENDPOINTS` key, building it on first use.
+    The whole payload (including paged and list responses) validates in one call.
+    """
+    return TypeAdapter(_endpoint_type(endpoint_key))
+
+
+def prebuild(endpoint_keys: Iterable[str] | None = None) -> None:
+    """Builds validators ahead of time, e.g. during a warm-up phase."""
+    for endpoint_key in endpoint_keys or ENDPOINTS:
+        get_adapter(endpoint_key)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Iterable, Self, TypeVar
+
+from .client import BrawlStarsClient, Polled
+
+if TYPE_CHECKING:
+    from .models import (
+        BattleLogEntry,
+        Brawler,
+        Club,
+        ClubMember,
+        ClubRanking,
+        EventEntry,
+        GameMode,
+        PagingResponse,
+        Player,
+        PlayerRanking,
+    )
+
+T = TypeVar("T")
+
+
+class SyncBrawlStarsClient:
+    """
+    Blocking facade over one long-lived `BrawlStarsClient`.
+
+    The async client runs on an event loop in a dedicated daemon thread, so
+    every calling thread shares its connection pool, cache and rate limiter.
+    Methods are safe to call from any thread except the loop thread itself.
+    `call_timeout` (seconds) bounds how long a caller blocks; the underlying
+    request is cancelled when it expires. Keyword arguments are passed to
+    `BrawlStarsClient`.
+
+    After a fork (e.g. Celery prefork workers) the child process starts its
+    own loop thread and client on first use.
+    """
+
+    def __init__(
+        self,
+        token: str | list[str],
+        *,
+        call_timeout: float | None = None,
+        **client_kwargs: Any,
+    ):
+        self._token = token
+        self._client_kwargs = client_kwargs
+        self.call_timeout = call_timeout
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: BrawlStarsClient | None = None
+        self._start()
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="brawldogg-loop", daemon=True
+        )
+        thread.start()
+
+        async def create() -> BrawlStarsClient:
+            # Built on the loop so asyncio primitives bind to it
+            return BrawlStarsClient(self._token, **self._client_kwargs)
+
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+        self._client = asyncio.run_coroutine_threadsafe(create(), loop).result()
+
+    @property
+    def client(self) -> BrawlStarsClient:
+        """The underlying async client (only use it on the loop thread)."""
+        self._ensure_running()
+        return self._client
+
+    def _ensure_running(self) -> None:
+        if self._closed:
+            raise RuntimeError("Client is closed")
+        if self._pid != os.getpid():
+            with self._lock:
+                # The loop thread doesn't survive fork(); start a fresh one
+                if self._pid != os.getpid():
+                    self._start()
+
+    def _run(self, call: Callable[[BrawlStarsClient], Coroutine[Any, Any, T]]) -> T:
+        """
+        Runs `call(client)` on the loop and blocks for the result. The
+        coroutine is only created once the loop is known to belong to this
+        process, so the first call after a fork doesn't use the parent's client.
+        """
+        self._ensure_running()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Blocking call made from the client's own event loop")
+
+        future = asyncio.run_coroutine_threadsafe(call(self._client), self._loop)
+        try:
+            return future.result(self.call_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    @staticmethod
+    async def _gather(
+        client: BrawlStarsClient,
+        method: str,
+        keys: Iterable[Any],
+        concurrency: int,
+        priority: str,
+        return_exceptions: bool,
+    ) -> list[Any]:
+        fetch = getattr(client, method)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(key: Any) -> Any:
+            async with semaphore:
+                return await fetch(key)
+
+        with client.priority(priority):
+            return await asyncio.gather(
+                *(one(key) for key in keys), return_exceptions=return_exceptions
+            )
+
+    def map(
+        self,
+        method: str,
+        keys: Iterable[Any],
+        *,
+        concurrency: int = 16,
+        priority: str = "bulk",
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Calls a single-argument client method (e.g. "get_player") for every key
+        concurrently on the loop and blocks until all finish. Results keep the
+        order of `keys`; with `return_exceptions`, failures are returned in place.
+        """
+        keys = list(keys)
+        return self._run(
+            lambda c: self._gather(c, method, keys, concurrency, priority, return_exceptions)
+        )
+
+    # ──────────────────────────────────────────────────────────────
+    # Blocking API Methods
+    # ──────────────────────────────────────────────────────────────
+
+    def poll(
+        self,
+        endpoint_key: str,
+        *,
+        path_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+        refresh: bool = False,
+    ) -> Polled:
+        return self._run(
+            lambda c: c.poll(
+                endpoint_key,
+                path_params=path_params,
+                query_params=query_params,
+                refresh=refresh,
+            )
+        )
+
+    def get_player(self, tag: str) -> Player:
+        return self._run(lambda c: c.get_player(tag))
+
+    def get_player_battlelog(self, tag: str) -> PagingResponse[BattleLogEntry]:
+        return self._run(lambda c: c.get_player_battlelog(tag))
+
+    def get_club(self, tag: str) -> Club:
+        return self._run(lambda c: c.get_club(tag))
+
+    def get_club_members(
+        self,
+        tag: str,
+        *,
+        limit: int = 30,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[ClubMember]:
+        return self._run(
+            lambda c: c.get_club_members(tag, limit=limit, after=after, before=before)
+        )
+
+    def get_gamemodes(
+        self,
+        *,
+        limit: int = 100,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[GameMode]:
+        return self._run(
+            lambda c: c.get_gamemodes(limit=limit, after=after, before=before)
+        )
+
+    def get_current_events(self, *, refresh: bool = False) -> list[EventEntry]:
+        return self._run(lambda c: c.get_current_events(refresh=refresh))
+
+    def get_brawlers(
+        self,
+        *,
+        limit: int = 100,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[Brawler]:
+        return self._run(
+            lambda c: c.get_brawlers(limit=limit, after=after, before=before)
+        )
+
+    def get_brawler(self, brawler_id: int) -> Brawler:
+        return self._run(lambda c: c.get_brawler(brawler_id))
+
+    def get_player_rankings(
+        self,
+        country: str = "global",
+        *,
+        limit: int = 200,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[PlayerRanking]:
+        return self._run(
+            lambda c: c.get_player_rankings(
+                country, limit=limit, after=after, before=before
+            )
+        )
+
+    def get_club_rankings(
+        self,
+        country: str = "global",
+        *,
+        limit: int = 200,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[ClubRanking]:
+        return self._run(
+            lambda c: c.get_club_rankings(
+                country, limit=limit, after=after, before=before
+            )
+        )
+
+    def get_brawler_rankings(
+        self,
+        brawler_id: int,
+        country: str = "global",
+        *,
+        limit: int = 200,
+        after: str | None = None,
+        before: str | None = None,
+    ) -> PagingResponse[PlayerRanking]:
+        return self._run(
+            lambda c: c.get_brawler_rankings(
+                brawler_id, country, limit=limit, after=after, before=before
+            )
+        )
+
+    # Bulk Methods
+    def get_players(self, tags: Iterable[str], **kwargs: Any) -> list[Player]:
+        return self.map("get_player", tags, **kwargs)
+
+    def get_battlelogs(
+        self, tags: Iterable[str], **kwargs: Any
+    ) -> list[PagingResponse[BattleLogEntry]]:
+        return self.map("get_player_battlelog", tags, **kwargs)
+
+    def get_clubs(self, tags: Iterable[str], **kwargs: Any) -> list[Club]:
+        return self.map("get_club", tags, **kwargs)
+
+    # ──────────────────────────────────────────────────────────────
+    # Lifecycle
+    # ──────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._pid != os.getpid():
+                # Inherited from the parent process: there is no loop thread here
+                return
+
+            loop, thread = self._loop, self._thread
+            try:
+                asyncio.run_coroutine_threadsafe(self._client.close(), loop).result()
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,49 @@
+from .rate_limiter import RateLimiter
+
+
+class AdmissionPolicy:
+    """
+    Queue-depth-aware admission control.
+
+    A request is over the limit when its priority lane already holds
+    `max_queue_depth[priority]` waiters, or when its expected rate-limiter
+    wait exceeds `max_wait[priority]` seconds. Over-limit requests are served
+    from the cache even if the entry expired (up to `stale_ttl` seconds ago)
+    when `serve_stale` is set, and rejected with `Overloaded` otherwise.
+    Lanes without a limit are always admitted.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue_depth: dict[str, int] | None = None,
+        max_wait: dict[str, float] | None = None,
+        serve_stale: bool = True,
+        stale_ttl: int = 60 * 60,
+    ):
+        self.max_queue_depth = dict(max_queue_depth or {})
+        self.max_wait = dict(max_wait or {})
+        self.serve_stale = serve_stale
+        self.stale_ttl = stale_ttl
+        self.shed: dict[str, int] = {}
+        self.degraded: dict[str, int] = {}
+
+    def check(self, limiter: RateLimiter, priority: str) -> str | None:
+        """Returns why a new request in `priority` can't be admitted, or None."""
+        if (depth := self.max_queue_depth.get(priority)) is not None:
+            if (queued := limiter.queue_depth(priority)) >= depth:
+                return f"{queued} requests queued in the {priority!r} lane (max {depth})"
+
+        if (wait := self.max_wait.get(priority)) is not None:
+            if (expected := limiter.expected_wait(priority)) > wait:
+                return (
+                    f"Expected wait of {expected:.2f}s in the {priority!r} lane "
+                    f"exceeds {wait:.2f}s"
+                )
+        return None
+
+    def record_shed(self, priority: str) -> None:
+        self.shed[priority] = self.shed.get(priority, 0) + 1
+
+    def record_degraded(self, priority: str) -> None:
+        self.degraded[priority] = self.degraded.get(priority, 0) + 1
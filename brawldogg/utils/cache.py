@@ -5,10 +5,14 @@ from threading import Lock
 
 
 class TTLCache:
-    def __init__(self, default_ttl: int = 60, maxsize: int | None = None):
+    def __init__(
+        self, default_ttl: int = 60, maxsize: int | None = None, stale_ttl: int = 0
+    ):
         self.cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
         self.default_ttl = default_ttl
         self.maxsize = maxsize
+        # Expired entries are kept this much longer for get_stale()
+        self.stale_ttl = stale_ttl
         self._lock = Lock()
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -17,14 +21,39 @@ class TTLCache:
         except KeyError:
             return default
 
-    def set(self, key: str, value: Any, ttl: int | None = None):
-        self.__setitem__(key, value, ttl)
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        expires_at: float | None = None,
+    ):
+        """Stores `value` for `ttl` seconds, or until the `expires_at` timestamp if given."""
+        if expires_at is None:
+            self.__setitem__(key, value, ttl)
+            return
+
+        with self._lock:
+            self._store(key, value, expires_at)
+
+    def get_stale(self, key: str, default: Any = None) -> Any:
+        """Returns the entry even if it expired, as long as it is within `stale_ttl`."""
+        with self._lock:
+            if (entry := self.cache.get(key)) is None:
+                return default
+            value, expiry = entry
+            if time() > expiry + self.stale_ttl:
+                del self.cache[key]
+                return default
+            return value
 
     def _is_expired(self, key: str, expiry: float) -> bool:
-        if time() > expiry:
+        now = time()
+        if now <= expiry:
+            return False
+        if now > expiry + self.stale_ttl:
             del self.cache[key]
-            return True
-        return False
+        return True
 
     def __contains__(self, key: str) -> bool:
         with self._lock:
@@ -47,15 +76,22 @@ class TTLCache:
     def __setitem__(self, key: str, value: Any, ttl: int | None = None):
         with self._lock:
             ttl = ttl or self.default_ttl
-            self.cache[key] = (value, time() + ttl)
-            self.cache.move_to_end(key)
-            if self.maxsize is not None and len(self.cache) > self.maxsize:
-                self.cache.popitem(last=False)
+            self._store(key, value, time() + ttl)
+
+    def _store(self, key: str, value: Any, expiry: float):
+        self.cache[key] = (value, expiry)
+        self.cache.move_to_end(key)
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
 
     def __delitem__(self, key: str):
         with self._lock:
             del self.cache[key]
 
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self.cache)
+
     def __len__(self) -> int:
         with self._lock:
             return len(self.cache)
@@ -0,0 +1,36 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Absolute deadline on the time.monotonic() clock, if any
+_deadline: ContextVar[float | None] = ContextVar("brawldogg_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bounds the total time of every request made inside the block, including
+    rate-limiter waits, connection pool acquisition, attempts and backoff.
+
+        with deadline(0.5):
+            player = await bs.get_player(tag)
+
+    Nested deadlines never extend an outer one.
+    """
+    expires = time.monotonic() + seconds
+    if (outer := _deadline.get()) is not None:
+        expires = min(expires, outer)
+
+    reset = _deadline.set(expires)
+    try:
+        yield
+    finally:
+        _deadline.reset(reset)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline, or None without one."""
+    if (expires := _deadline.get()) is None:
+        return None
+    return expires - time.monotonic()
@@ -0,0 +1,23 @@
+from datetime import timezone
+from typing import Any, Callable
+
+from .validators import parse_time
+
+# Route → hook computing when a raw payload stops being valid (epoch seconds),
+# or None to fall back to the regular TTL.
+ExpiryHook = Callable[[Any], float | None]
+
+
+def earliest_end_time(payload: Any) -> float | None:
+    """Earliest `endTime` of an event rotation payload."""
+    end_times = [
+        parse_time(entry["endTime"]).replace(tzinfo=timezone.utc).timestamp()
+        for entry in payload
+        if "endTime" in entry
+    ]
+    return min(end_times, default=None)
+
+
+EXPIRY_HOOKS: dict[str, ExpiryHook] = {
+    "events": earliest_end_time,
+}
@@ -0,0 +1,83 @@
+import math
+from collections import deque
+
+
+class LatencyTracker:
+    """Sliding window of response latencies per route, used to derive percentiles."""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, route: str, latency: float) -> None:
+        if (samples := self._samples.get(route)) is None:
+            samples = self._samples[route] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def count(self, route: str) -> int:
+        return len(self._samples.get(route, ()))
+
+    def quantile(self, route: str, q: float) -> float | None:
+        if not (samples := self._samples.get(route)):
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgingPolicy:
+    """
+    Opt-in request hedging for latency-sensitive routes.
+
+    If a request on one of `routes` hasn't answered after the observed
+    `quantile` latency for that route (clamped to [min_delay, max_delay]),
+    a second copy is sent and the first response wins. Hedges are capped at
+    `budget` (a fraction of all requests) and are not sent until the route
+    has `min_samples` latency observations.
+    """
+
+    def __init__(
+        self,
+        *,
+        routes: frozenset[str] | set[str] = frozenset({"player", "club"}),
+        quantile: float = 0.95,
+        budget: float = 0.05,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        min_samples: int = 20,
+        window: int = 500,
+    ):
+        self.routes = frozenset(routes)
+        self.quantile = quantile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker(window)
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record_request(self) -> None:
+        self.requests += 1
+
+    def record_latency(self, route: str, latency: float) -> None:
+        self.latencies.record(route, latency)
+
+    def delay_for(self, route: str) -> float | None:
+        """Returns how long to wait before hedging, or None if the route isn't hedged."""
+        if route not in self.routes:
+            return None
+        if self.latencies.count(route) < self.min_samples:
+            return None
+
+        threshold = self.latencies.quantile(route, self.quantile)
+        return min(self.max_delay, max(self.min_delay, threshold))
+
+    def try_spend(self) -> bool:
+        """Reserves a hedge if doing so keeps hedges within the budget."""
+        if self.hedges + 1 > self.budget * self.requests:
+            return False
+        self.hedges += 1
+        return True
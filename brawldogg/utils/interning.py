@@ -0,0 +1,140 @@
+import sys
+from typing import Any, Iterable
+
+from ..models.battlelog import (
+    BattleBrawler,
+    BattleLogEntry,
+    BattlePlayer,
+    DuelPlayer,
+)
+from ..models.events import Event
+from ..models.registry import get_adapter
+
+
+def _model_size(model: Any) -> int:
+    """Approximate shallow footprint of a pydantic model instance."""
+    return (
+        sys.getsizeof(model)
+        + sys.getsizeof(model.__dict__)
+        + sys.getsizeof(model.__pydantic_fields_set__)
+    )
+
+
+class BattleLogInterner:
+    """
+    Deduplicates repeated data across many `BattleLogEntry` objects.
+
+    Strings (tags, names, modes, maps, result/type literals) are interned so
+    identical values share one object, identical `Event` objects are shared
+    across entries, and identical `BattleBrawler` objects (same brawler, power,
+    trophies and trophy change) are shared across players. Shared objects
+    must be treated as read-only. `saved_bytes` estimates the memory saved.
+    """
+
+    def __init__(self):
+        self._strings: dict[str, str] = {}
+        self._events: dict[tuple, Event] = {}
+        self._brawlers: dict[tuple, BattleBrawler] = {}
+        self.strings_reused = 0
+        self.events_shared = 0
+        self.brawlers_shared = 0
+        self.saved_bytes = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "unique_strings": len(self._strings),
+            "strings_reused": self.strings_reused,
+            "unique_events": len(self._events),
+            "events_shared": self.events_shared,
+            "unique_brawlers": len(self._brawlers),
+            "brawlers_shared": self.brawlers_shared,
+            "saved_bytes": self.saved_bytes,
+        }
+
+    def intern(self, value: str | None) -> str | None:
+        if value is None:
+            return None
+        cached = self._strings.setdefault(value, value)
+        if cached is not value:
+            self.strings_reused += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return cached
+
+    def _intern_fields(self, model: Any, *names: str) -> None:
+        # Write through __dict__: plain assignment would go through pydantic's __setattr__
+        fields = model.__dict__
+        for name in names:
+            if isinstance(value := fields.get(name), str):
+                fields[name] = self.intern(value)
+
+    def _event(self, event: Event) -> Event:
+        key = (event.id, event.mode_id, event.mode, event.map)
+        if (shared := self._events.get(key)) is None:
+            self._intern_fields(event, "mode", "map")
+            self._events[key] = event
+            return event
+
+        if shared is not event:
+            self.events_shared += 1
+            self.saved_bytes += _model_size(event)
+        return shared
+
+    def _brawler(self, brawler: BattleBrawler) -> BattleBrawler:
+        key = (
+            brawler.id,
+            brawler.name,
+            brawler.power,
+            brawler.trophies,
+            brawler.trophy_change,
+        )
+        if (shared := self._brawlers.get(key)) is None:
+            self._intern_fields(brawler, "name")
+            self._brawlers[key] = brawler
+            return brawler
+
+        if shared is not brawler:
+            self.brawlers_shared += 1
+            self.saved_bytes += _model_size(brawler)
+        return shared
+
+    def _player(self, player: BattlePlayer | DuelPlayer) -> None:
+        self._intern_fields(player, "tag", "name")
+        fields = player.__dict__
+        if isinstance(player, DuelPlayer):
+            fields["brawlers"] = [self._brawler(b) for b in player.brawlers]
+        else:
+            fields["brawler"] = self._brawler(player.brawler)
+
+    def intern_entry(self, entry: BattleLogEntry) -> BattleLogEntry:
+        """Interns one entry in place and returns it."""
+        entry.__dict__["event"] = self._event(entry.event)
+
+        battle = entry.battle
+        self._intern_fields(battle, "mode", "type", "result")
+
+        if (teams := getattr(battle, "teams", None)) is not None:
+            for team in teams:
+                for player in team:
+                    self._player(player)
+        for player in getattr(battle, "players", ()):
+            self._player(player)
+        if (star_player := getattr(battle, "star_player", None)) is not None:
+            self._player(star_player)
+        return entry
+
+    def intern_entries(self, entries: Iterable[BattleLogEntry]) -> list[BattleLogEntry]:
+        return [self.intern_entry(entry) for entry in entries]
+
+    def parse_battlelogs(self, payloads: Iterable[Any]) -> list[BattleLogEntry]:
+        """Validates raw battle log payloads (dicts or JSON bytes) and interns every entry."""
+        adapter = get_adapter("battlelog")
+        entries: list[BattleLogEntry] = []
+        for payload in payloads:
+            page = (
+                adapter.validate_json(payload)
+                if isinstance(payload, (bytes, str))
+                else adapter.validate_python(payload)
+            )
+            entries.extend(self.intern_entry(entry) for entry in page.items)
+        return entries
@@ -0,0 +1,98 @@
+import math
+from hashlib import blake2b
+
+from ..exceptions import HTTPException, exception_for_status
+from .cache import TTLCache
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Answers "definitely not present" without touching the backing cache,
+    so lookups of live tags stay cheap even with a very large set of dead ones.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing: h1 + i * h2 gives k independent-enough positions from one digest
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self) -> None:
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+
+class NegativeCache:
+    """
+    Caches error responses (by default only 404) so repeated lookups of
+    dead or mistyped tags raise immediately without a network call.
+
+    Entries are stored as compact (status, reason, message) tuples with a
+    per-status TTL, behind a Bloom filter that short-circuits misses.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[int, int] | None = None,
+        *,
+        maxsize: int = 100_000,
+        error_rate: float = 0.01,
+    ):
+        self.ttls = dict(ttls) if ttls is not None else {404: 60}
+        self.cache = TTLCache(maxsize=maxsize)
+        # Sized at twice the cache so a rebuild (which leaves at most `maxsize`
+        # keys set) is followed by at least `maxsize` adds before the next one
+        self.bloom = BloomFilter(2 * maxsize, error_rate)
+        self.hits = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.ttls)
+
+    def get(self, key: str) -> HTTPException | None:
+        """Returns the cached error for `key`, or None."""
+        if key not in self.bloom:
+            return None
+        if (entry := self.cache.get(key)) is None:
+            return None
+
+        self.hits += 1
+        return exception_for_status(*entry)
+
+    def add(self, key: str, exc: HTTPException) -> None:
+        if (ttl := self.ttls.get(exc.status)) is None:
+            return
+
+        self.cache.set(key, (exc.status, exc.reason, exc.message), ttl)
+        self.bloom.add(key)
+
+        # Expired and evicted keys stay set in the filter; rebuild it from the
+        # live entries once it has absorbed more keys than it was sized for.
+        if self.bloom.count > self.bloom.capacity:
+            self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> None:
+        self.bloom.clear()
+        for key in self.cache.keys():
+            # Membership checks drop expired entries, so they aren't re-added
+            if key in self.cache:
+                self.bloom.add(key)
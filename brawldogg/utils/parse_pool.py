@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+
+def _validate_batch(batch: list[tuple[str, bytes]]) -> list[tuple[bool, Any]]:
+    """Worker entry point: decodes and validates raw bodies with the endpoint validators."""
+    from ..models.registry import get_adapter
+
+    results: list[tuple[bool, Any]] = []
+    for endpoint_key, body in batch:
+        try:
+            results.append((True, get_adapter(endpoint_key).validate_json(body)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+def _gil_disabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class ParsePool:
+    """
+    Offloads JSON decoding and model validation off the event loop.
+
+    Raw response bodies are queued and shipped to the executor in batches
+    (up to `batch_size` bodies, or whatever arrived within `batch_delay`
+    seconds) to amortize IPC. By default a process pool is used; on a
+    free-threaded interpreter worker threads are used instead, since they
+    run in parallel without pickling.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        *,
+        workers: int | None = None,
+        batch_size: int = 32,
+        batch_delay: float = 0.002,
+    ):
+        if executor is None:
+            workers = workers or os.cpu_count() or 1
+            executor = (
+                ThreadPoolExecutor(workers)
+                if _gil_disabled()
+                else ProcessPoolExecutor(workers)
+            )
+            self._owned_executor = True
+        else:
+            self._owned_executor = False
+
+        self.executor = executor
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self._pending: list[tuple[str, bytes, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def parse(self, endpoint_key: str, body: bytes) -> Any:
+        """Validates a raw body into the endpoint's model in a worker."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((endpoint_key, body, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(
+            self.executor, _validate_batch, [(key, body) for key, body, _ in batch]
+        )
+        job.add_done_callback(lambda done: self._deliver(batch, done))
+
+    @staticmethod
+    def _deliver(batch: list[tuple[str, bytes, asyncio.Future]], job: asyncio.Future):
+        error = asyncio.CancelledError() if job.cancelled() else job.exception()
+        if error is not None:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (*_, future), (ok, value) in zip(batch, job.result()):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def close(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._owned_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
+
+from ..constants import ENDPOINTS
+from ..exceptions import HTTPException
+from .tag_parser import normalize_tag
+
+if TYPE_CHECKING:
+    from ..client import BrawlStarsClient
+
+log = logging.getLogger("brawldogg.planner")
+
+
+class JobRequest(NamedTuple):
+    endpoint_key: str
+    path_params: dict[str, Any] | None = None
+    query_params: dict[str, Any] | None = None
+
+
+class JobPlan:
+    """Request cost and timing estimate for a job."""
+
+    def __init__(
+        self,
+        requests: list[JobRequest],
+        cached: int,
+        known_missing: int,
+        cost: int,
+        eta: float,
+        remaining: int | None,
+    ):
+        self.requests = requests
+        self.cached = cached
+        self.known_missing = known_missing
+        # Expected requests sent, 429/403 retries included
+        self.cost = cost
+        self.eta = eta
+        self.remaining = remaining
+
+    @property
+    def fits(self) -> bool:
+        return self.remaining is None or self.cost <= self.remaining
+
+    def __repr__(self) -> str:
+        return (
+            f"JobPlan(requests={len(self.requests)}, cached={self.cached}, "
+            f"known_missing={self.known_missing}, cost={self.cost}, "
+            f"eta={self.eta:.1f}s, remaining={self.remaining})"
+        )
+
+
+class JobResult:
+    def __init__(self):
+        self.results: list[tuple[JobRequest, Any]] = []
+        self.errors: dict[str, int] = {}
+        self.skipped: list[JobRequest] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"JobResult(results={len(self.results)}, errors={self.errors}, "
+            f"skipped={len(self.skipped)})"
+        )
+
+
+class JobPlanner:
+    """
+    Estimates and runs bulk jobs against the request budget.
+
+    A job is a list of `JobRequest`s. `plan()` counts how many are already
+    served by the cache or the negative cache, scales the rest by the retry
+    overhead observed by the client's `QuotaTracker`, and derives an ETA
+    from the rate limiter's throughput. `run()` executes a plan in the bulk
+    lane and stops sending requests once only `reserve` requests are left
+    in the budget; optionally it spreads the requests over `spread_over`
+    seconds to leave headroom for other traffic.
+    """
+
+    def __init__(self, client: "BrawlStarsClient", *, reserve: int = 0):
+        self.client = client
+        self.reserve = reserve
+
+    @staticmethod
+    def tags(endpoint_key: str, tags: Iterable[str]) -> list[JobRequest]:
+        """One request per tag, e.g. `JobPlanner.tags("player", tags)`."""
+        return [JobRequest(endpoint_key, {"tag": normalize_tag(tag)}) for tag in tags]
+
+    @staticmethod
+    def rankings(
+        countries: Iterable[str],
+        endpoint_key: str = "rankings_players",
+        *,
+        limit: int = 200,
+        **path_params: Any,
+    ) -> list[JobRequest]:
+        """One rankings page per country (brawler rankings also need `id=`)."""
+        return [
+            JobRequest(endpoint_key, {"country": c, **path_params}, {"limit": limit})
+            for c in countries
+        ]
+
+    def _state(self, request: JobRequest) -> str | None:
+        """'cached', 'missing' (negative cache) or None if a request is needed."""
+        client = self.client
+        endpoint = ENDPOINTS[request.endpoint_key].format(**(request.path_params or {}))
+        cache_key = client._generate_cache_key(
+            "GET", f"{client.base_url}{endpoint}", request.query_params
+        )
+        decode = client.parse_pool is None and not client.reuse_unchanged
+        if (cache_key if decode else f"raw:{cache_key}") in client.cache:
+            return "cached"
+        # Checked directly: NegativeCache.get() would count a hit
+        negative = client.negative_cache
+        if negative and cache_key in negative.bloom and cache_key in negative.cache:
+            return "missing"
+        return None
+
+    def remaining(self) -> int | None:
+        """
+        Requests left for the job: the budget of the first token, which every
+        first attempt is sent with (other tokens only see 403/429 retries).
+        """
+        if self.client.quota is None:
+            return None
+        if (left := self.client.quota.remaining(self.client.tokens[0])) is None:
+            return None
+        return max(0, left - self.reserve)
+
+    def plan(self, requests: Iterable[JobRequest]) -> JobPlan:
+        requests = list(requests)
+        states = [self._state(r) for r in requests]
+        cached = states.count("cached")
+        missing = states.count("missing")
+
+        overhead = self.client.quota.retry_overhead() if self.client.quota else 1.0
+        cost = math.ceil((len(requests) - cached - missing) * overhead)
+
+        limiter = self.client.rate_limiter
+        eta = cost * limiter.per / limiter.rate + limiter.expected_wait("bulk")
+        return JobPlan(requests, cached, missing, cost, eta, self.remaining())
+
+    async def run(
+        self,
+        plan: JobPlan,
+        *,
+        concurrency: int = 8,
+        priority: str = "bulk",
+        spread_over: float | None = None,
+    ) -> JobResult:
+        result = JobResult()
+        queue = list(reversed(plan.requests))
+        interval = spread_over / plan.cost if spread_over and plan.cost else 0.0
+        next_start = time.monotonic()
+        out_of_budget = False
+
+        # Requests are only counted by the QuotaTracker once sent (after the
+        # limiter wait), so workers reserve their share of the budget before
+        # fetching rather than checking a count that lags behind.
+        left = self.remaining()
+        overhead = self.client.quota.retry_overhead() if self.client.quota else 1.0
+        per_request = max(1, math.ceil(overhead))
+        in_flight = 0
+        settled = asyncio.Condition()
+
+        async def reserve() -> int | None:
+            """Reserves budget for one request; None once the budget is spent."""
+            nonlocal left, in_flight, out_of_budget
+            if left is None:
+                return 0
+            async with settled:
+                # In-flight requests may still return unused reservations
+                while left < per_request and in_flight and not out_of_budget:
+                    await settled.wait()
+                if out_of_budget or left < per_request:
+                    out_of_budget = True
+                    return None
+                left -= per_request
+                in_flight += per_request
+                return per_request
+
+        async def settle(reserved: int) -> None:
+            nonlocal left, in_flight
+            async with settled:
+                in_flight -= reserved
+                # Resync with the tracker, which also sees retries beyond the
+                # reservation and traffic from outside the job
+                left = self.remaining() - in_flight
+                settled.notify_all()
+
+        async def worker() -> None:
+            nonlocal next_start
+            while queue:
+                request = queue.pop()
+                reserved = 0
+
+                if self._state(request) is None:
+                    if (reserved := await reserve()) is None:
+                        result.skipped.append(request)
+                        continue
+                    if interval:
+                        start = max(next_start, time.monotonic())
+                        next_start = start + interval
+                        if (wait := start - time.monotonic()) > 0:
+                            await asyncio.sleep(wait)
+                    # Another worker may have fetched it meanwhile: refund
+                    if reserved and self._state(request) is not None:
+                        await settle(reserved)
+                        reserved = 0
+
+                try:
+                    model = await self.client._fetch_endpoint(
+                        request.endpoint_key, request.path_params, request.query_params
+                    )
+                    result.results.append((request, model))
+                except HTTPException as e:
+                    name = type(e).__name__
+                    result.errors[name] = result.errors.get(name, 0) + 1
+                finally:
+                    if reserved:
+                        await settle(reserved)
+
+        with self.client.priority(priority):
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        if result.skipped:
+            log.warning(
+                f"Request budget exhausted: skipped {len(result.skipped)} of {len(plan.requests)} requests"
+            )
+        return result
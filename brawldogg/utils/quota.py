@@ -0,0 +1,148 @@
+import json
+import time
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+
+KINDS = ("requests", "cache_saved", "rate_limited", "forbidden")
+
+DAY = 24 * 60 * 60
+
+
+def token_id(token: str) -> str:
+    """Stable, non-reversible identifier for a token (tokens are never stored)."""
+    return sha256(token.encode("utf-8")).hexdigest()[:12]
+
+
+class QuotaTracker:
+    """
+    Per-token request accounting over sliding windows.
+
+    Counts requests sent, requests saved by the cache, 429s and 403s per
+    token in `bucket`-second buckets, kept for `retention` seconds.
+    `budgets` maps token ids (see `token_id`) to a request budget per
+    `budget_window` seconds; "*" is the budget of every token not listed.
+    Budgets are always per token, as the API enforces them per key. If
+    `path` is given, counters are loaded from it and written back by `save()`.
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, int] | None = None,
+        *,
+        budget_window: float = DAY,
+        bucket: float = 60.0,
+        retention: float = DAY,
+        path: str | Path | None = None,
+    ):
+        self.budgets = dict(budgets or {})
+        self.budget_window = budget_window
+        self.bucket = bucket
+        self.retention = max(retention, budget_window)
+        self.path = Path(path) if path is not None else None
+        # token id → kind → bucket index → count
+        self._counts: dict[str, dict[str, dict[int, int]]] = {}
+        self._lock = Lock()
+
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def _bucket_index(self, now: float) -> int:
+        return int(now // self.bucket)
+
+    def _prune(self, buckets: dict[int, int], now: float) -> None:
+        oldest = self._bucket_index(now - self.retention)
+        for index in [i for i in buckets if i < oldest]:
+            del buckets[index]
+
+    def record(self, token: str, kind: str, count: int = 1) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown quota counter: {kind}")
+        now = time.time()
+        with self._lock:
+            kinds = self._counts.setdefault(token_id(token), {})
+            buckets = kinds.setdefault(kind, {})
+            index = self._bucket_index(now)
+            buckets[index] = buckets.get(index, 0) + count
+            if len(buckets) > self.retention / self.bucket + 1:
+                self._prune(buckets, now)
+
+    def count(
+        self, kind: str, window: float | None = None, *, token: str | None = None
+    ) -> int:
+        """Events of `kind` within the last `window` seconds, for one token (raw or id) or all."""
+        window = window if window is not None else self.budget_window
+        since = self._bucket_index(time.time() - window)
+        with self._lock:
+            if token is None:
+                ids = list(self._counts)
+            else:
+                ids = [token if token in self._counts else token_id(token)]
+            return sum(
+                n
+                for tid in ids
+                for index, n in self._counts.get(tid, {}).get(kind, {}).items()
+                if index > since
+            )
+
+    def budget(self, token: str) -> int | None:
+        """The budget of one token (raw or id), or None if it has none."""
+        tid = token if token in self.budgets else token_id(token)
+        return self.budgets.get(tid, self.budgets.get("*"))
+
+    def remaining(self, token: str) -> int | None:
+        """Requests left for one token in the current budget window, or None without a budget."""
+        if (budget := self.budget(token)) is None:
+            return None
+        return max(0, budget - self.count("requests", token=token))
+
+    def retry_overhead(self, window: float = 60 * 60) -> float:
+        """Requests sent per successful request lately (429/403 retries included)."""
+        sent = self.count("requests", window)
+        failed = self.count("rate_limited", window) + self.count("forbidden", window)
+        if sent == 0 or failed >= sent:
+            return 1.0
+        return sent / (sent - failed)
+
+    def snapshot(self, window: float | None = None) -> dict[str, dict[str, int]]:
+        """Token id → kind → count within `window` (default: the budget window)."""
+        with self._lock:
+            ids = list(self._counts)
+        return {
+            tid: {kind: self.count(kind, window, token=tid) for kind in KINDS}
+            for tid in ids
+        }
+
+    def save(self, path: str | Path | None = None) -> None:
+        if (path := Path(path) if path is not None else self.path) is None:
+            raise ValueError("No path to save quota counters to")
+        now = time.time()
+        with self._lock:
+            for kinds in self._counts.values():
+                for buckets in kinds.values():
+                    self._prune(buckets, now)
+            data = {
+                "bucket": self.bucket,
+                "counts": {
+                    tid: {
+                        kind: {str(i): n for i, n in buckets.items()}
+                        for kind, buckets in kinds.items()
+                    }
+                    for tid, kinds in self._counts.items()
+                },
+            }
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(path)
+
+    def load(self, path: str | Path) -> None:
+        """Merges counters saved by `save()` into this tracker."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        scale = data.get("bucket", self.bucket) / self.bucket
+        with self._lock:
+            for tid, kinds in data.get("counts", {}).items():
+                for kind, buckets in kinds.items():
+                    target = self._counts.setdefault(tid, {}).setdefault(kind, {})
+                    for index, n in buckets.items():
+                        index = int(int(index) * scale)
+                        target[index] = target.get(index, 0) + n
@@ -1,52 +1,207 @@
-import time
 import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+DEFAULT_WEIGHTS = {"interactive": 8.0, "normal": 4.0, "bulk": 1.0}
+
+
+class LaneStats:
+    """Counters for a single priority lane."""
+
+    def __init__(self):
+        self.depth = 0
+        self.served = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.served if self.served else 0.0
+
+    def record(self, wait: float) -> None:
+        self.served += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
 
 
 class RateLimiter:
     """
-    Asynchronous Token Bucket Rate Limiter.
+    Asynchronous Token Bucket Rate Limiter with weighted fair queuing.
+
+    Waiters are grouped into named priority lanes (by default `interactive`,
+    `normal` and `bulk`). When tokens are scarce, each waiter gets a virtual
+    finish time of `max(virtual_now, lane_last_finish) + 1 / weight` and the
+    smallest finish time is served first, so a lane with weight 8 gets eight
+    slots for every one of a weight-1 lane while both are backlogged, and an
+    interactive call never waits behind the whole bulk queue.
+
+    Optional per-route concurrency caps bound how many requests for a route
+    can be in flight at once (see `limit`).
     """
 
-    def __init__(self, rate: int = 20, per: float = 1.0):
+    def __init__(
+        self,
+        rate: int = 20,
+        per: float = 1.0,
+        *,
+        weights: dict[str, float] | None = None,
+        concurrency: dict[str, int] | None = None,
+    ):
         self.rate = rate  # Max tokens per 'per' period
         self.per = per  # Time period (e.g., 1.0 second)
         self.allowance = float(rate)  # Initial tokens
-        self.last_check = time.time()
-        self.lock = asyncio.Lock()
+        self.last_check = time.monotonic()
         self.refill_time = self.per / self.rate  # Time required to earn one token
 
-    async def acquire(self):
-        async with self.lock:
-            current = time.time()
-            time_passed = current - self.last_check
-            self.last_check = current
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.stats = {lane: LaneStats() for lane in self.weights}
+
+        self.concurrency = dict(concurrency or {})
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+        # Heap of (finish_tag, seq, lane, enqueued_at, future)
+        self._queue: list[tuple[float, int, str, float, asyncio.Future]] = []
+        self._virtual_time = 0.0
+        self._last_finish: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._dispatcher: asyncio.Task | None = None
 
-            # 1. Refill allowance
-            self.allowance += time_passed / self.refill_time
+    def _refill(self) -> None:
+        current = time.monotonic()
+        time_passed = current - self.last_check
+        self.last_check = current
 
-            # 2. Cap at maximum capacity
-            if self.allowance > self.rate:
-                self.allowance = float(self.rate)
+        # Refill allowance, capped at maximum capacity
+        self.allowance = min(
+            float(self.rate), self.allowance + time_passed / self.refill_time
+        )
 
-            # 3. Check for consumption
-            if self.allowance >= 1.0:
-                # If we have enough, consume one token and exit
-                self.allowance -= 1.0
+    def queue_depth(self, priority: str | None = None) -> int:
+        """Number of waiters in a lane, or in all lanes if no lane is given."""
+        if priority is not None:
+            return self.stats[priority].depth
+        return sum(stats.depth for stats in self.stats.values())
+
+    def expected_wait(self, priority: str = "normal") -> float:
+        """
+        Estimated seconds a new waiter in `priority` would wait for a token.
+
+        While the lane drains its own backlog, every other lane is served in
+        proportion to its weight (bounded by its own backlog).
+        """
+        self._refill()
+        weight = self.weights[priority]
+        own = self.stats[priority].depth + 1
+        ahead = float(own)
+        for lane, stats in self.stats.items():
+            if lane != priority:
+                ahead += min(stats.depth, own * self.weights[lane] / weight)
+        return max(0.0, ahead - self.allowance) * self.refill_time
+
+    async def acquire(
+        self, priority: str = "normal", timeout: float | None = None
+    ) -> None:
+        """
+        Waits for a token in the given lane. Raises `asyncio.TimeoutError`
+        (leaving the queue) if none is granted within `timeout` seconds.
+        """
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority lane: {priority!r}")
+
+        self._refill()
+        stats = self.stats[priority]
+
+        # Fast path: nobody is waiting and a token is available
+        if not self._queue and self.allowance >= 1.0:
+            self.allowance -= 1.0
+            stats.record(0.0)
+            return
+
+        start = max(self._virtual_time, self._last_finish.get(priority, 0.0))
+        finish = start + 1.0 / self.weights[priority]
+        self._last_finish[priority] = finish
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queue,
+            (finish, next(self._seq), priority, time.monotonic(), future),
+        )
+        stats.depth += 1
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            if future.cancelled():
+                stats.depth -= 1
+                self._rollback(priority, finish)
             else:
-                # If not enough, calculate wait time to earn the token
+                # The token was granted just before we got cancelled: give it back
+                self.allowance += 1.0
+            raise
+
+    def _rollback(self, lane: str, finish: float) -> None:
+        """
+        Pulls a lane's last finish tag back after its tail waiter left, so
+        timed-out or cancelled waiters don't leave phantom virtual time that
+        pushes the lane's next waiters behind other lanes.
+        """
+        if self._last_finish.get(lane) != finish:
+            return  # A live waiter queued later still holds the tail
+        live = [
+            tag
+            for tag, _, waiter_lane, _, future in self._queue
+            if waiter_lane == lane and not future.cancelled()
+        ]
+        if live:
+            self._last_finish[lane] = max(live)
+        else:
+            del self._last_finish[lane]
+
+    async def _dispatch(self) -> None:
+        """Hands out tokens to queued waiters in virtual finish-time order."""
+        while self._queue:
+            finish, _, lane, enqueued_at, future = self._queue[0]
+            if future.cancelled():
+                heapq.heappop(self._queue)
+                continue
 
-                # How many tokens we are short of (1.0 - allowance)
-                tokens_needed = 1.0 - self.allowance
+            self._refill()
+            if self.allowance < 1.0:
+                # Wait for the time required to earn the missing fraction of a token
+                await asyncio.sleep((1.0 - self.allowance) * self.refill_time)
+                continue
 
-                # Time to wait to earn those tokens (tokens_needed * refill_time)
-                wait_time = tokens_needed * self.refill_time
+            heapq.heappop(self._queue)
+            self.allowance -= 1.0
+            self._virtual_time = finish
 
-                # Log or debug here if needed
-                # print(f"Insufficient tokens. Waiting for {wait_time:.3f}s")
+            stats = self.stats[lane]
+            stats.depth -= 1
+            stats.record(time.monotonic() - enqueued_at)
+            future.set_result(None)
 
-                # Wait for the required time
-                await asyncio.sleep(wait_time)
+    @asynccontextmanager
+    async def limit(
+        self, route: str, timeout: float | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Holds one of the route's concurrency slots, if the route is capped.
+        Raises `asyncio.TimeoutError` if no slot frees up within `timeout`.
+        """
+        if (cap := self.concurrency.get(route)) is None:
+            yield
+            return
 
-                # Since we waited exactly the time needed to earn the token,
-                # the allowance is now 1.0, so we set it back to 0.
-                self.allowance = 0.0
+        if (semaphore := self._semaphores.get(route)) is None:
+            semaphore = self._semaphores[route] = asyncio.Semaphore(cap)
+        await asyncio.wait_for(semaphore.acquire(), timeout)
+        try:
+            yield
+        finally:
+            semaphore.release()
@@ -0,0 +1,224 @@
+import asyncio
+import base64
+import gzip
+import json
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..constants import ENDPOINTS
+from ..exceptions import HTTPException
+
+if TYPE_CHECKING:
+    from ..http_client import HTTPClient
+
+# The body is stored decoded, so encoding/length headers no longer apply
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_ROUTES = [
+    (re.compile("^" + re.sub(r"\{\w+\}", "[^/]+", template) + "$"), key)
+    for key, template in ENDPOINTS.items()
+]
+
+
+def route_for(endpoint: str) -> str:
+    """Maps a concrete endpoint path (e.g. /players/%23ABC) to its ENDPOINTS key."""
+    for pattern, key in _ROUTES:
+        if pattern.match(endpoint):
+            return key
+    return endpoint
+
+
+def _request_key(method: str, path: str, params: list[list[str]]) -> tuple:
+    return (method, path, tuple(sorted(tuple(p) for p in params)))
+
+
+def _path(url: httpx.URL) -> str:
+    # URL.path is percent-decoded; keep the encoded form (%23 for '#') as sent
+    return urlsplit(str(url)).path
+
+
+def _headers(headers: httpx.Headers) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+
+
+def load_recording(path: str | Path) -> list[dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a transport and appends every exchange to a gzipped NDJSON file:
+    offset from the start of the recording, method, path, query params,
+    status, response headers, body and latency. Request headers (and with
+    them the API tokens) are never written.
+    """
+
+    def __init__(
+        self, path: str | Path, transport: httpx.AsyncBaseTransport | None = None
+    ):
+        self.path = Path(path)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._file = gzip.open(self.path, "at", encoding="utf-8")
+        self._start = time.monotonic()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        body = await response.aread()
+        latency = time.monotonic() - started
+
+        try:
+            stored_body, encoded = body.decode("utf-8"), False
+        except UnicodeDecodeError:
+            stored_body, encoded = base64.b64encode(body).decode("ascii"), True
+
+        headers = _headers(response.headers)
+        origin = request.extensions.get("brawldogg", {})
+        record = {
+            "t": round(started - self._start, 6),
+            "method": request.method,
+            "path": _path(request.url),
+            "params": list(request.url.params.multi_items()),
+            "status": response.status_code,
+            "headers": headers,
+            "body": stored_body,
+            "b64": encoded,
+            "latency": round(latency, 6),
+            "attempt": origin.get("attempt", 0),
+            "hedge": origin.get("hedge", False),
+        }
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        self._file.close()
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves recorded responses, injectable via `HTTPClient(session=httpx.AsyncClient(transport=...))`.
+
+    Responses for the same request are served in recorded order (so 429/403
+    sequences reproduce) and cycle once exhausted. Each response is delayed
+    by its recorded latency times `time_scale` (0 disables delays).
+    Unrecorded requests get a 404.
+    """
+
+    def __init__(self, path: str | Path, *, time_scale: float = 1.0):
+        self.time_scale = time_scale
+        self._responses: dict[tuple, deque[dict[str, Any]]] = {}
+        for record in load_recording(path):
+            key = _request_key(record["method"], record["path"], record["params"])
+            self._responses.setdefault(key, deque()).append(record)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = _request_key(
+            request.method, _path(request.url), list(request.url.params.multi_items())
+        )
+        if not (queue := self._responses.get(key)):
+            return httpx.Response(
+                404,
+                json={"reason": "notFound", "message": "No recorded response"},
+                request=request,
+            )
+
+        record = queue.popleft()
+        queue.append(record)
+
+        if self.time_scale > 0:
+            await asyncio.sleep(record["latency"] * self.time_scale)
+
+        body = record["body"]
+        content = base64.b64decode(body) if record.get("b64") else body.encode("utf-8")
+        return httpx.Response(
+            record["status"],
+            headers=record["headers"],
+            content=content,
+            request=request,
+        )
+
+
+class ReplayReport:
+    def __init__(self):
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.latencies: list[float] = []
+        self.duration = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def __repr__(self) -> str:
+        return (
+            f"ReplayReport(requests={self.requests}, errors={self.errors}, "
+            f"throughput={self.throughput:.1f}/s, p50={self.percentile(50):.3f}s, "
+            f"p99={self.percentile(99):.3f}s)"
+        )
+
+
+async def replay_traffic(
+    client: "HTTPClient", path: str | Path, *, time_scale: float = 1.0
+) -> ReplayReport:
+    """
+    Re-issues a recorded request mix through `client` (caching, rate limiting,
+    retries and all) at the recorded arrival times scaled by `time_scale`,
+    and reports throughput, end-to-end latencies and errors.
+    """
+    base_path = urlsplit(client.base_url).path
+    report = ReplayReport()
+
+    async def issue(record: dict[str, Any]) -> None:
+        endpoint = record["path"].removeprefix(base_path)
+        started = time.monotonic()
+        try:
+            await client._request(
+                "GET",
+                endpoint,
+                params=dict(record["params"]) or None,
+                route=route_for(endpoint),
+            )
+        except HTTPException as e:
+            name = type(e).__name__
+            report.errors[name] = report.errors.get(name, 0) + 1
+        report.requests += 1
+        report.latencies.append(time.monotonic() - started)
+
+    # Only first attempts are replayed: retries and hedges are re-created by
+    # the client's own policies (and served from the recording by ReplayTransport).
+    records = [
+        r
+        for r in load_recording(path)
+        if r["method"] == "GET" and r.get("attempt", 0) == 0 and not r.get("hedge")
+    ]
+    start = time.monotonic()
+    tasks = []
+    for record in records:
+        if (wait := start + record["t"] * time_scale - time.monotonic()) > 0:
+            await asyncio.sleep(wait)
+        tasks.append(asyncio.create_task(issue(record)))
+    await asyncio.gather(*tasks)
+
+    report.duration = time.monotonic() - start
+    return report
@@ -0,0 +1,123 @@
+import random
+import time
+
+import httpx
+
+from ..exceptions import HTTPException
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to back off between attempts.
+
+    Backoff uses decorrelated jitter (sleep = uniform(base, previous * 3), capped
+    at max_delay) so concurrent workers don't retry in lockstep. The total time
+    spent sleeping across all attempts of one request is capped by `budget`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget: float | None = 60.0,
+        retry_statuses: frozenset[int] | set[int] = frozenset({429, 500, 502, 503, 504}),
+        retry_exceptions: tuple[type[Exception], ...] = (
+            httpx.TimeoutException,
+            httpx.TransportError,
+        ),
+        status_delays: dict[int, float] | None = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        # Per-status minimum delay, e.g. {429: 1.0} to always wait at least 1s on throttling
+        self.status_delays = status_delays or {}
+
+    def is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, HTTPException):
+            return exc.status in self.retry_statuses
+        return isinstance(exc, self.retry_exceptions)
+
+    def next_delay(self, previous: float, exc: Exception) -> float:
+        """Decorrelated jitter backoff based on the previous delay."""
+        previous = max(previous, self.base_delay)
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+        if isinstance(exc, HTTPException):
+            delay = max(delay, self.status_delays.get(exc.status, 0.0))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After `failure_threshold` consecutive upstream failures the circuit opens and
+    requests fail fast for `recovery_time` seconds. Afterwards a single probe
+    request is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = self.CLOSED
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self.opened_at >= self.recovery_time
+        ):
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit allows a probe request."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_time - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        match self.state:
+            case self.CLOSED:
+                return True
+            case self.HALF_OPEN if not self._probe_in_flight():
+                self._probe_started = time.monotonic()
+                return True
+            case _:
+                return False
+
+    def _probe_in_flight(self) -> bool:
+        # A probe that never reported back (e.g. cancelled) is considered lost
+        # after another recovery period, so the circuit can't get stuck half-open.
+        return (
+            self._probe_started is not None
+            and time.monotonic() - self._probe_started < self.recovery_time
+        )
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probe_started = None
+        self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self.opened_at = time.monotonic()
+        self._probe_started = None
@@ -0,0 +1,19 @@
+from .clubs import (
+    ClubEvent,
+    ClubWatcher,
+    MemberJoined,
+    MemberLeft,
+    RoleChanged,
+    TrophiesChanged,
+)
+from .rotation import RotationWatcher
+
+__all__ = [
+    "RotationWatcher",
+    "ClubWatcher",
+    "ClubEvent",
+    "MemberJoined",
+    "MemberLeft",
+    "RoleChanged",
+    "TrophiesChanged",
+]
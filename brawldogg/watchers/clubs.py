@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Iterable
+
+from pydantic import BaseModel
+
+from ..constants import ENDPOINTS
+from ..exceptions import HTTPException
+from ..models.constants import CLUB_ROLES
+from ..utils.tag_parser import normalize_tag
+
+if TYPE_CHECKING:
+    from ..client import BrawlStarsClient
+
+log = logging.getLogger("brawldogg.watchers")
+
+ROLE_ORDER = {
+    "notMember": 0,
+    "unknown": 0,
+    "member": 1,
+    "senior": 2,
+    "vicePresident": 3,
+    "president": 4,
+}
+
+
+class ClubEvent(BaseModel):
+    club_tag: str
+    tag: str
+
+
+class MemberJoined(ClubEvent):
+    name: str
+    role: CLUB_ROLES
+    trophies: int
+
+
+class MemberLeft(ClubEvent):
+    role: CLUB_ROLES
+    trophies: int
+
+
+class RoleChanged(ClubEvent):
+    old_role: CLUB_ROLES
+    new_role: CLUB_ROLES
+
+    @property
+    def promoted(self) -> bool:
+        return ROLE_ORDER[self.new_role] > ROLE_ORDER[self.old_role]
+
+
+class TrophiesChanged(ClubEvent):
+    old_trophies: int
+    new_trophies: int
+
+    @property
+    def delta(self) -> int:
+        return self.new_trophies - self.old_trophies
+
+
+class ClubState:
+    """Compact per-club state: body digest and member tag → (role, trophies)."""
+
+    __slots__ = ("digest", "members")
+
+    def __init__(self, digest: bytes, members: dict[str, tuple[str, int]]):
+        self.digest = digest
+        self.members = members
+
+
+def diff_members(
+    club_tag: str,
+    old: dict[str, tuple[str, int]],
+    new: dict[str, tuple[str, int]],
+    names: dict[str, str],
+) -> list[ClubEvent]:
+    """Linear-time diff of two member maps into typed events."""
+    events: list[ClubEvent] = []
+    for tag, (role, trophies) in new.items():
+        if (before := old.get(tag)) is None:
+            events.append(
+                MemberJoined(
+                    club_tag=club_tag,
+                    tag=tag,
+                    name=names.get(tag, ""),
+                    role=role,
+                    trophies=trophies,
+                )
+            )
+            continue
+
+        old_role, old_trophies = before
+        if role != old_role:
+            events.append(
+                RoleChanged(club_tag=club_tag, tag=tag, old_role=old_role, new_role=role)
+            )
+        if trophies != old_trophies:
+            events.append(
+                TrophiesChanged(
+                    club_tag=club_tag,
+                    tag=tag,
+                    old_trophies=old_trophies,
+                    new_trophies=trophies,
+                )
+            )
+
+    for tag, (role, trophies) in old.items():
+        if tag not in new:
+            events.append(
+                MemberLeft(club_tag=club_tag, tag=tag, role=role, trophies=trophies)
+            )
+    return events
+
+
+class ClubWatcher:
+    """
+    Membership change feed for many clubs.
+
+    Each poll fetches the raw club payload and compares a digest of the body
+    with the previous one; unchanged clubs cost a hash and nothing else.
+    Changed bodies are decoded into a compact member map (no model
+    validation) and diffed against the previous map.
+    """
+
+    def __init__(self, client: "BrawlStarsClient"):
+        self.client = client
+        self.states: dict[str, ClubState] = {}
+        self.polls = 0
+        self.unchanged = 0
+
+    async def poll(self, tag: str) -> list[ClubEvent]:
+        """Polls one club and returns the events since the previous poll."""
+        url_tag = normalize_tag(tag)
+        club_tag = f"#{url_tag[3:]}"
+
+        body = await self.client._request(
+            "GET",
+            ENDPOINTS["club"].format(tag=url_tag),
+            route="club",
+            refresh=True,
+            decode=False,
+        )
+        self.polls += 1
+
+        digest = blake2b(body, digest_size=16).digest()
+        state = self.states.get(club_tag)
+        if state is not None and state.digest == digest:
+            self.unchanged += 1
+            return []
+
+        try:
+            raw_members = json.loads(body).get("members", ())
+            members = {m["tag"]: (m["role"], m["trophies"]) for m in raw_members}
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed club payload for {club_tag}: {e!r}") from e
+
+        # The first poll only establishes the baseline
+        events: list[ClubEvent] = []
+        if state is not None:
+            names = {
+                m["tag"]: m["name"] for m in raw_members if m["tag"] not in state.members
+            }
+            events = diff_members(club_tag, state.members, members, names)
+
+        # Only stored once the events are built, so a bad payload is retried
+        self.states[club_tag] = ClubState(digest, members)
+        return events
+
+    async def poll_many(
+        self, tags: Iterable[str], *, concurrency: int = 8
+    ) -> list[ClubEvent]:
+        """Polls many clubs concurrently; clubs that fail to load are skipped."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def poll_one(tag: str) -> list[ClubEvent]:
+            async with semaphore:
+                try:
+                    return await self.poll(tag)
+                except (HTTPException, ValueError) as e:
+                    log.warning(f"Club poll for {tag} failed: {e}")
+                    return []
+
+        results = await asyncio.gather(*(poll_one(tag) for tag in tags))
+        return [event for events in results for event in events]
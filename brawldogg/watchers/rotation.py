@@ -0,0 +1,112 @@
+import asyncio
+import inspect
+import logging
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from ..exceptions import HTTPException
+
+if TYPE_CHECKING:
+    from ..client import BrawlStarsClient
+    from ..models import EventEntry
+
+log = logging.getLogger("brawldogg.watchers")
+
+RotationCallback = Callable[[list["EventEntry"]], Awaitable[None] | None]
+
+
+def _rotation_key(events: list["EventEntry"]) -> frozenset[tuple[int, int, datetime]]:
+    return frozenset((e.slot_id, e.event.id, e.start_time) for e in events)
+
+
+class RotationWatcher:
+    """
+    Refreshes the event rotation right at slot boundaries and notifies subscribers.
+
+    The watcher sleeps until the earliest `end_time` of the current rotation
+    (plus `grace` seconds), refetches, and calls every subscriber when the
+    rotation changed. If the API still serves the old rotation, it retries
+    every `retry_interval` seconds until the new one appears.
+    """
+
+    def __init__(
+        self,
+        client: "BrawlStarsClient",
+        *,
+        grace: float = 2.0,
+        retry_interval: float = 10.0,
+        max_sleep: float = 60 * 60,
+    ):
+        self.client = client
+        self.grace = grace
+        self.retry_interval = retry_interval
+        self.max_sleep = max_sleep
+        self.current: list["EventEntry"] = []
+        self._subscribers: list[RotationCallback] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, callback: RotationCallback) -> Callable[[], None]:
+        """Registers a (sync or async) callback; returns a function that unsubscribes it."""
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def next_boundary(self) -> datetime | None:
+        """When the earliest event of the current rotation ends (naive UTC)."""
+        return min((e.end_time for e in self.current), default=None)
+
+    async def _notify(self, events: list["EventEntry"]) -> None:
+        for callback in list(self._subscribers):
+            try:
+                result = callback(events)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                log.exception("Rotation subscriber failed")
+
+    def _seconds_until_boundary(self) -> float:
+        if (boundary := self.next_boundary()) is None:
+            return self.retry_interval
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        wait = (boundary - now).total_seconds() + self.grace
+        return min(self.max_sleep, max(0.0, wait))
+
+    async def poll(self, *, refresh: bool = False) -> bool:
+        """Fetches the rotation; notifies and returns True if it changed."""
+        events = await self.client.get_current_events(refresh=refresh)
+        if _rotation_key(events) == _rotation_key(self.current):
+            return False
+
+        self.current = events
+        await self._notify(events)
+        return True
+
+    async def run(self) -> None:
+        while True:
+            try:
+                if not self.current:
+                    # Initial load (retried until it succeeds)
+                    await self.poll()
+                else:
+                    # The boundary passed, so the cached rotation has expired anyway;
+                    # refresh explicitly in case the API still served the old one.
+                    while not await self.poll(refresh=True):
+                        await asyncio.sleep(self.retry_interval)
+            except HTTPException as e:
+                log.warning(f"Rotation refresh failed: {e}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            await asyncio.sleep(self._seconds_until_boundary())
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
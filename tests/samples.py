@@ -0,0 +1,22 @@
+BATTLE = {
+    "battleTime": "20251118T183123.000Z",
+    "event": {"id": 15000005, "mode": "brawlBall", "modeId": 5, "map": "Super Beach"},
+    "battle": {
+        "mode": "brawlBall",
+        "type": "ranked",
+        "result": "victory",
+        "duration": 120,
+        "trophyChange": 8,
+        "teams": [
+            [
+                {
+                    "tag": f"#P{team}{i}",
+                    "name": f"Player {team}{i}",
+                    "brawler": {"id": 16000000 + i, "name": "SHELLY", "power": 11, "trophies": 750},
+                }
+                for i in range(3)
+            ]
+            for team in range(2)
+        ],
+    },
+}
@@ -0,0 +1,47 @@
+import asyncio
+
+import httpx
+
+from brawldogg.client import BrawlStarsClient
+from brawldogg.watchers.clubs import ClubWatcher, MemberJoined
+
+
+def member(tag: str, role: str = "member", trophies: int = 100) -> dict:
+    return {"tag": tag, "name": tag, "role": role, "trophies": trophies}
+
+
+def test_poll_keeps_state_on_bad_payload_and_skips_dead_clubs():
+    bodies = {
+        "#AAA": [
+            {"members": [member("#P1")]},
+            {"members": [{"tag": "#P2"}]},  # missing fields
+            {"members": [member("#P1"), member("#P2")]},
+        ]
+    }
+    sent: dict[str, int] = {}
+
+    def handler(request):
+        tag = request.url.path.rsplit("/", 1)[-1]
+        sent[tag] = sent.get(tag, 0) + 1
+        if tag not in bodies:
+            return httpx.Response(404, json={"reason": "notFound"})
+        return httpx.Response(200, json=bodies[tag][min(sent[tag], 3) - 1])
+
+    async def main():
+        client = BrawlStarsClient(
+            "token", session=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        watcher = ClubWatcher(client)
+        try:
+            rounds = [await watcher.poll_many(["#AAA", "#BBB"]) for _ in range(3)]
+        finally:
+            await client.close()
+        return rounds
+
+    first, second, third = asyncio.run(main())
+    assert first == [] and second == []
+    # The bad payload didn't replace the baseline, so the join still shows up
+    assert [type(e) for e in third] == [MemberJoined]
+    assert third[0].tag == "#P2"
+    # The 404 is remembered across polls
+    assert sent["#BBB"] == 1
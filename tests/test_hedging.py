@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import httpx
+
+from brawldogg.http_client import HTTPClient
+from brawldogg.utils.hedging import HedgingPolicy
+from brawldogg.utils.rate_limiter import RateLimiter
+
+
+def test_hedge_waiting_for_rate_limit_does_not_delay_primary():
+    sends = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sends
+        sends += 1
+        await asyncio.sleep(0.3)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        hedging = HedgingPolicy(routes={"player"}, budget=1.0, min_samples=1)
+        hedging.record_latency("player", 0.05)
+        client = HTTPClient(
+            "token",
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hedging=hedging,
+        )
+        # One slot per second: the hedge would have to wait ~1s for its slot
+        client.rate_limiter = RateLimiter(rate=1, per=1.0)
+
+        started = time.monotonic()
+        data = await client._request("GET", "/players/%23A", route="player")
+        elapsed = time.monotonic() - started
+        await client.close()
+        return data, elapsed
+
+    data, elapsed = asyncio.run(main())
+    assert data == {"ok": True}
+    assert elapsed < 0.8
+    assert sends == 1
@@ -0,0 +1,50 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from brawldogg.history.store import CHUNK_POINTS, PLAYER_FIELDS, SnapshotStore
+
+
+def player(tag: str = "#A", **fields) -> SimpleNamespace:
+    values = dict.fromkeys(PLAYER_FIELDS, 1)
+    values.update(fields)
+    return SimpleNamespace(tag=tag, brawlers=[], **values)
+
+
+def test_history_is_written_in_chunks(tmp_path):
+    path = tmp_path / "history.db"
+    store = SnapshotStore(path)
+    points = 3 * CHUNK_POINTS + 5
+    for i in range(points):
+        store.record(player(trophies=i + 10), at=1_000 + i)
+    store.close()
+
+    conn = sqlite3.connect(path)
+    chunks = conn.execute(
+        "SELECT COUNT(*) FROM chunks WHERE field = 'trophies'"
+    ).fetchone()[0]
+    conn.close()
+    assert chunks == 4
+
+    reopened = SnapshotStore(path)
+    history = reopened.series("#A", "trophies", since=0, until=10_000)
+    assert [value for _, value in history] == [i + 10 for i in range(points)]
+
+
+def test_rejected_snapshot_changes_nothing():
+    store = SnapshotStore()
+    store.record(player(trophies=5), at=100)
+    with pytest.raises(ValueError):
+        store.record(player(trophies=6), at=50)
+    assert store.value_at("#A", "trophies", at=100) == 5
+    assert len(store._load("#A")["trophies"]) == 1
+
+
+def test_series_cache_is_bounded():
+    store = SnapshotStore(cache_size=2)
+    for tag in ("#A", "#B", "#C"):
+        store.record(player(tag), at=100)
+    assert list(store._series) == ["#B", "#C"]
+    # Evicted tags reload from the database
+    assert store.value_at("#A", "trophies", at=100) == 1
@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from brawldogg.exceptions import CircuitOpen, HTTPException, NetworkError
+from brawldogg.http_client import HTTPClient
+from brawldogg.utils.retry import CircuitBreaker, RetryPolicy
+
+FAST = dict(base_delay=0.001, max_delay=0.005)
+
+
+def make_client(handler, **kwargs) -> HTTPClient:
+    return HTTPClient(
+        "token",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def request(client: HTTPClient, endpoint: str = "/players/%23A"):
+    return client._request("GET", endpoint, route="player", use_cache=False)
+
+
+def test_5xx_is_retried_until_success():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(503, json={"reason": "unavailable"})
+        return httpx.Response(200, json={"tag": "#A"})
+
+    async def main():
+        client = make_client(handler, retry_policy=RetryPolicy(**FAST))
+        try:
+            return await request(client)
+        finally:
+            await client.close()
+
+    assert asyncio.run(main()) == {"tag": "#A"}
+    assert calls == 2
+
+
+def test_retry_budget_stops_retrying():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, json={"reason": "unavailable"})
+
+    policy = RetryPolicy(max_attempts=10, base_delay=0.05, max_delay=0.05, budget=0.1)
+
+    async def main():
+        client = make_client(handler, retry_policy=policy)
+        try:
+            with pytest.raises(HTTPException) as info:
+                await request(client)
+            return info.value
+        finally:
+            await client.close()
+
+    assert asyncio.run(main()).status == 503
+    # Two 0.05s backoffs fit the 0.1s budget; the third would exceed it
+    assert calls == 3
+
+
+def test_transport_error_becomes_network_error():
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def main():
+        client = make_client(handler, retry_policy=RetryPolicy(max_attempts=2, **FAST))
+        try:
+            with pytest.raises(NetworkError) as info:
+                await request(client)
+            return info.value
+        finally:
+            await client.close()
+
+    error = asyncio.run(main())
+    assert error.status == 0
+    assert error.reason == "ConnectError"
+    assert calls == 2
+
+
+def test_breaker_opens_half_opens_and_closes():
+    calls = 0
+    healthy = False
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        if healthy:
+            return httpx.Response(200, json={"tag": "#A"})
+        return httpx.Response(500, json={"reason": "error"})
+
+    async def main():
+        nonlocal healthy
+        client = make_client(
+            handler,
+            retry_policy=RetryPolicy(max_attempts=1),
+            breaker_threshold=2,
+            breaker_recovery=0.1,
+        )
+        try:
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await request(client)
+            breaker = client.breakers["player"]
+            assert breaker.state == CircuitBreaker.OPEN
+
+            # Open: fails fast without reaching the upstream
+            with pytest.raises(CircuitOpen):
+                await request(client)
+            assert calls == 2
+
+            await asyncio.sleep(0.12)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+            healthy = True
+            assert await request(client) == {"tag": "#A"}
+            assert breaker.state == CircuitBreaker.CLOSED
+            assert calls == 3
+        finally:
+            await client.close()
+
+    asyncio.run(main())
+
+
+def test_failed_half_open_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()  # the probe
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
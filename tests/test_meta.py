@@ -0,0 +1,34 @@
+import time
+from datetime import datetime, timedelta
+
+from brawldogg.analytics.meta import MetaAggregator
+from brawldogg.models.registry import get_adapter
+
+from samples import BATTLE
+
+ENTRY = get_adapter("battlelog").validate_python(
+    {"items": [BATTLE], "paging": {"cursors": {}}}
+).items[0]
+
+
+def test_many_battles_within_horizon_stay_fast():
+    meta = MetaAggregator(window=3600)
+    start = datetime(2025, 11, 18)
+    total = 130_000
+
+    began = time.perf_counter()
+    for chunk in range(0, total, 1000):
+        entries = [
+            ENTRY.model_copy(update={"battle_time": start + timedelta(seconds=i)})
+            for i in range(chunk, chunk + 1000)
+        ]
+        assert meta.add("#P00", entries) == 1000
+    elapsed = time.perf_counter() - began
+
+    assert meta.rollup().totals()[1] == total
+    # All battles are within the dedup horizon: none may be forgotten
+    assert len(meta._seen) == total
+    # Re-adding is fully deduplicated
+    assert meta.add("#P10", [ENTRY.model_copy(update={"battle_time": start})]) == 0
+    # Quadratic re-pruning took tens of seconds here
+    assert elapsed < 15
@@ -0,0 +1,43 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from brawldogg.models import BattleLogEntry, PagingResponse
+from brawldogg.utils.parse_pool import ParsePool
+
+from samples import BATTLE
+
+
+def test_paged_body_round_trips_through_process_pool():
+    body = json.dumps({"items": [BATTLE] * 3, "paging": {"cursors": {}}}).encode()
+    members = json.dumps(
+        {
+            "items": [
+                {
+                    "tag": "#ABC",
+                    "name": "Member",
+                    "nameColor": "0xffffffff",
+                    "role": "member",
+                    "trophies": 100,
+                    "icon": {"id": 28000000},
+                }
+            ],
+            "paging": {"cursors": {}},
+        }
+    ).encode()
+
+    async def main():
+        pool = ParsePool(ProcessPoolExecutor(1))
+        try:
+            return await asyncio.gather(
+                pool.parse("battlelog", body), pool.parse("club_members", members)
+            )
+        finally:
+            pool.executor.shutdown()
+
+    page, member_page = asyncio.run(main())
+    assert isinstance(page, PagingResponse)
+    assert len(page.items) == 3
+    assert isinstance(page.items[0], BattleLogEntry)
+    assert page.items[0].event.map == "Super Beach"
+    assert member_page.items[0].tag == "#ABC"
@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+
+from brawldogg.client import BrawlStarsClient
+from brawldogg.utils.planner import JobPlanner, JobRequest
+from brawldogg.utils.quota import QuotaTracker
+from brawldogg.utils.rate_limiter import RateLimiter
+
+BRAWLER = {"id": 16000000, "name": "SHELLY", "starPowers": [], "gadgets": []}
+
+
+def test_concurrent_workers_stay_within_budget():
+    sent = 0
+
+    async def handler(request):
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=BRAWLER)
+
+    async def main():
+        quota = QuotaTracker({"*": 10})
+        client = BrawlStarsClient(
+            "token",
+            session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            quota=quota,
+        )
+        # Slow limiter: requests are only counted once they get a slot
+        client.rate_limiter = RateLimiter(rate=5, per=0.1)
+        planner = JobPlanner(client)
+        plan = planner.plan(JobRequest("brawler", {"id": i}) for i in range(50))
+        result = await planner.run(plan, concurrency=8)
+        await client.close()
+        return result
+
+    result = asyncio.run(main())
+    assert sent == 10
+    assert len(result.results) == 10
+    assert len(result.skipped) == 40
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+import pytest
+
+from brawldogg.utils.rate_limiter import RateLimiter
+
+
+def _drained(rate: int) -> RateLimiter:
+    limiter = RateLimiter(rate=rate, per=1.0)
+    limiter.allowance = 0.0
+    limiter.last_check = time.monotonic()
+    return limiter
+
+
+def test_timed_out_waiters_leave_no_phantom_virtual_time():
+    async def main():
+        limiter = _drained(100)
+        bulk = [asyncio.create_task(limiter.acquire("bulk")) for _ in range(50)]
+        await asyncio.sleep(0)
+
+        async def give_up():
+            with pytest.raises(asyncio.TimeoutError):
+                await limiter.acquire("interactive", timeout=0.001)
+
+        await asyncio.gather(*(give_up() for _ in range(400)))
+
+        started = time.monotonic()
+        await limiter.acquire("interactive")
+        waited = time.monotonic() - started
+        for task in bulk:
+            task.cancel()
+        await asyncio.gather(*bulk, return_exceptions=True)
+        return waited
+
+    # Without the rollback this waited behind all 50 bulk waiters (~0.5s)
+    assert asyncio.run(main()) < 0.1
+
+
+def test_lanes_are_served_by_weight():
+    async def main():
+        limiter = _drained(1000)
+        order: list[str] = []
+
+        async def wait(lane: str):
+            await limiter.acquire(lane)
+            order.append(lane)
+
+        # Bulk queues first, but interactive has 8x the weight
+        tasks = [asyncio.create_task(wait("bulk")) for _ in range(8)]
+        tasks += [asyncio.create_task(wait("interactive")) for _ in range(8)]
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(main())
+    last_interactive = max(i for i, lane in enumerate(order) if lane == "interactive")
+    second_bulk = [i for i, lane in enumerate(order) if lane == "bulk"][1]
+    assert last_interactive < second_bulk
+
+
+def test_acquire_timeout_leaves_the_queue():
+    async def main():
+        limiter = _drained(1)
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire("normal", timeout=0.05)
+        assert limiter.queue_depth() == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def main():
+        limiter = _drained(20)
+        waiter = asyncio.create_task(limiter.acquire("normal"))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth("normal") == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth() == 0
+
+        # The slot it would have taken goes to the next waiter
+        await asyncio.wait_for(limiter.acquire("normal"), 1.0)
+        assert limiter.stats["normal"].served == 1
+
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from brawldogg.export.sinks import ParquetSink, Sink
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_sink_requires_write_batch():
+    with pytest.raises(TypeError):
+        Sink()
+
+
+def test_parquet_sink_keeps_columns_added_after_first_batch(tmp_path):
+    path = tmp_path / "out.parquet"
+
+    async def main():
+        async with ParquetSink(path) as sink:
+            await sink.write_batch([{"tag": "#A", "club": None}])
+            await sink.write_batch([{"tag": "#B"}])
+            await sink.write_batch([{"tag": "#C", "club": "#X", "trophies": 5}])
+        return sink.paths
+
+    paths = asyncio.run(main())
+    rows = [row for p in paths for row in pq.read_table(p).to_pylist()]
+    assert rows == [
+        {"tag": "#A", "club": None},
+        {"tag": "#B", "club": None},
+        {"tag": "#C", "club": "#X", "trophies": 5},
+    ]
+    assert paths[1].name == "out-1.parquet"
+
+
+def test_parquet_sink_with_explicit_schema(tmp_path):
+    import pyarrow as pa
+
+    schema = pa.schema([("tag", pa.string()), ("club", pa.string())])
+    path = tmp_path / "out.parquet"
+
+    async def main():
+        async with ParquetSink(path, schema=schema) as sink:
+            await sink.write_batch([{"tag": "#A", "club": None}])
+            await sink.write_batch([{"tag": "#B", "club": "#X"}])
+            with pytest.raises(ValueError):
+                await sink.write_batch([{"tag": "#C", "unknown": 1}])
+
+    asyncio.run(main())
+    assert pq.read_table(path).to_pylist() == [
+        {"tag": "#A", "club": None},
+        {"tag": "#B", "club": "#X"},
+    ]